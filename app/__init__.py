@@ -8,7 +8,7 @@ from flask import Flask
 from flask_session import Session
 
 # Import extensions
-from models import db
+from models import db, upgrade_schema
 
 # Import centralized config
 from config import get_config
@@ -244,6 +244,7 @@ def register_cli_commands(app):
     def init_db():
         """Initialize the database"""
         db.create_all()
+        upgrade_schema()
         click.echo('Database initialized!')
     
     @app.cli.command()
@@ -3,7 +3,6 @@ Quiz Blueprint
 Handles quiz-related routes (elimination, finals, submission)
 """
 
-import json
 from flask import Blueprint, render_template, request, redirect, url_for, flash, session, jsonify
 from app.services import QuizService
 from app.repositories import QuizSessionRepository, QuizAttemptRepository
@@ -259,8 +258,8 @@ def submit_quiz():
     try:
         service = get_quiz_service()
         quiz_session = service.session_repo.get_by_id(session_id)
-        if quiz_session and quiz_session.questions_json:
-            questions = json.loads(quiz_session.questions_json)
+        if quiz_session:
+            questions = quiz_session.get_questions()
             
             for key, value in request.form.items():
                 if key.startswith('answer_'):
@@ -3,7 +3,7 @@ Base Repository Pattern Implementation
 Abstracts database operations for easier testing and migration
 """
 
-from typing import TypeVar, Generic, List, Optional
+from typing import TypeVar, Generic, List, Optional, Dict, Any
 from models import db
 
 T = TypeVar('T')
@@ -82,6 +82,30 @@ class BaseRepository(Generic[T]):
             db.session.rollback()
             raise
     
+    def bulk_create(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        Insert many entities in a single executemany round-trip
+        
+        Rows are plain column mappings; model __init__ is bypassed, so JSON
+        columns must already be serialized. Column defaults (id, created_at)
+        are still applied.
+        
+        Args:
+            rows: List of column-name to value dictionaries
+            
+        Returns:
+            Number of rows inserted
+        """
+        if not rows:
+            return 0
+        try:
+            db.session.bulk_insert_mappings(self.model_class, rows)
+            db.session.commit()
+            return len(rows)
+        except Exception:
+            db.session.rollback()
+            raise
+    
     def update(self, entity: T) -> T:
         """
         Update existing entity
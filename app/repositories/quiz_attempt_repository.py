@@ -5,7 +5,7 @@ Handles all database operations for QuizAttempt entities
 
 from typing import List, Optional, Dict
 from datetime import datetime, timedelta
-from sqlalchemy import desc, func
+from sqlalchemy import delete, desc, func
 from models import db, QuizAttempt
 from .base_repository import BaseRepository
 
@@ -250,8 +250,10 @@ class QuizAttemptRepository(BaseRepository[QuizAttempt]):
         Returns:
             Number of attempts deleted
         """
-        count = QuizAttempt.query.filter(
-            QuizAttempt.session_id.like('sample-%')
-        ).delete(synchronize_session=False)
+        # Core DELETE on the table: no ORM session synchronization needed
+        table = QuizAttempt.__table__
+        count = db.session.execute(
+            delete(table).where(table.c.session_id.like('sample-%'))
+        ).rowcount
         db.session.commit()
         return count
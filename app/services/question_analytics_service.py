@@ -6,9 +6,13 @@ from app.repositories.quiz_attempt_repository import QuizAttemptRepository
 from app.repositories.question_report_repository import QuestionReportRepository
 from config import get_config
 from sqlalchemy import func
+from sqlalchemy.orm import undefer
 from models import db, QuizAttempt
 import json
 
+# Number of attempts fetched per round-trip when scanning answer details
+ATTEMPT_BATCH_SIZE = 500
+
 
 class QuestionAnalyticsService:
     """Service for question-level analytics"""
@@ -18,6 +22,27 @@ class QuestionAnalyticsService:
         self.report_repo = QuestionReportRepository()
         self.config = get_config()
     
+    def _get_attempts_with_answers(self):
+        """
+        Stream all quiz attempts with their answer details
+        
+        answers_json is a deferred column; undefer it here so the loops
+        below don't issue one extra SELECT per attempt. Rows are fetched in
+        batches of ATTEMPT_BATCH_SIZE rather than materialized all at once,
+        with autoflush off since these reads never depend on pending writes.
+        Callers must consume the result in a single pass and not query the
+        database while iterating.
+        
+        Yields:
+            QuizAttempt objects
+        """
+        query = QuizAttempt.query.options(
+            undefer(QuizAttempt.answers_json)
+        ).yield_per(ATTEMPT_BATCH_SIZE)
+        
+        with db.session.no_autoflush:
+            yield from query
+    
     def get_question_statistics(self, limit=20):
         """
         Get comprehensive question statistics
@@ -43,7 +68,7 @@ class QuestionAnalyticsService:
             List of dicts with question details and miss statistics
         """
         # Get all quiz attempts
-        attempts = QuizAttempt.query.all()
+        attempts = self._get_attempts_with_answers()
         
         question_stats = {}
         
@@ -136,7 +161,7 @@ class QuestionAnalyticsService:
             min_attempts = self.config.MIN_ATTEMPTS_FOR_ANALYTICS
         
         # Get all quiz attempts
-        attempts = QuizAttempt.query.all()
+        attempts = self._get_attempts_with_answers()
         
         question_stats = {}
         
@@ -242,7 +267,7 @@ class QuestionAnalyticsService:
         Returns:
             List of questions with detailed improvement recommendations
         """
-        attempts = QuizAttempt.query.all()
+        attempts = self._get_attempts_with_answers()
         question_stats = {}
         
         for attempt in attempts:
@@ -361,7 +386,7 @@ class QuestionAnalyticsService:
         Returns:
             Detailed answer pattern analysis
         """
-        attempts = QuizAttempt.query.all()
+        attempts = self._get_attempts_with_answers()
         
         answer_data = {
             'total_attempts': 0,
@@ -459,7 +484,7 @@ class QuestionAnalyticsService:
             dict with detailed question analytics including answer frequency
         """
         # Get all attempts for this question
-        attempts = QuizAttempt.query.all()
+        attempts = self._get_attempts_with_answers()
         
         total_attempts = 0
         correct_count = 0
@@ -5,6 +5,9 @@ Handles business logic for quiz operations
 
 import json
 import random
+import sys
+from functools import lru_cache, partial
+from threading import Lock
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -14,6 +17,159 @@ from app.repositories.quiz_attempt_repository import QuizAttemptRepository
 from app.events.event_manager import event_manager, Event, EventType
 
 
+# Parsed data files keyed by path; an entry is reused while the file's mtime is unchanged
+_data_file_cache: Dict[Path, Tuple[float, object]] = {}
+_data_file_lock = Lock()
+
+# (signature, sorted topics) built by QuizService.get_available_topics; callers get shallow copies
+_topic_catalog = None
+_topic_catalog_lock = Lock()
+
+
+def _intern_question_strings(data):
+    """
+    Intern the short, frequently repeated strings of a parsed question file
+    
+    Answers, alternatives and options recur across questions and subtopics;
+    interning lets every cached copy share one string object. Alternatives
+    become shared tuples, since they are never modified. Explanations
+    are too long for sys.intern to be worthwhile, so identical texts are
+    collapsed through a pool instead. The pools only live for this call,
+    so reloading a changed file does not grow them.
+    
+    Args:
+        data: Parsed question file (dict with 'questions' or a bare list)
+        
+    Returns:
+        The same data, updated in place
+    """
+    questions = data.get('questions', []) if isinstance(data, dict) else data
+    explanation_pool: Dict[str, str] = {}
+    alternatives_pool: Dict[Tuple, Tuple] = {}
+    for q in questions:
+        if not isinstance(q, dict):
+            continue
+        if isinstance(q.get('answer'), str):
+            q['answer'] = sys.intern(q['answer'])
+        if isinstance(q.get('explanation'), str):
+            q['explanation'] = explanation_pool.setdefault(q['explanation'], q['explanation'])
+        options = q.get('options')
+        if isinstance(options, list):
+            q['options'] = [sys.intern(v) if isinstance(v, str) else v for v in options]
+        alternatives = q.get('alternatives')
+        if isinstance(alternatives, list):
+            # Alternatives are read-only; store them as pooled tuples
+            alternatives = tuple(sys.intern(v) if isinstance(v, str) else v for v in alternatives)
+            q['alternatives'] = alternatives_pool.setdefault(alternatives, alternatives)
+    return data
+
+
+def _build_question_bank(data, mode: str, source: Path) -> Dict:
+    """
+    Validate and normalize a parsed question file once, for caching
+    
+    Questions missing required fields are dropped and the answer key is
+    normalized to 'correct_answer', so quiz creation only has to sample.
+    
+    Args:
+        data: Parsed question file (dict with 'questions' or a bare list)
+        mode: Quiz mode ('elimination' or 'finals')
+        source: Path of the file, for error messages
+        
+    Returns:
+        Dict with topic_name, subtopic_name (None if absent) and an
+        immutable tuple of valid questions
+    """
+    if isinstance(data, dict) and 'questions' in data:
+        all_questions = data['questions']
+        topic_name = data.get('topic_name')
+        subtopic_name = data.get('subtopic_name')
+    elif isinstance(data, list):
+        all_questions = data
+        topic_name = subtopic_name = None
+    else:
+        raise ValueError(f"Invalid questions file format: {source}")
+    
+    _intern_question_strings(all_questions)
+    
+    # Validate questions have required fields
+    valid_questions = []
+    for q in all_questions:
+        # Check for elimination mode questions (multiple choice)
+        if mode == 'elimination':
+            if all(key in q for key in ['id', 'question', 'options']):
+                # Normalize the correct answer field
+                if 'correct' in q and 'correct_answer' not in q:
+                    q['correct_answer'] = q['correct']
+                elif 'correct_answer' not in q and 'correct' not in q:
+                    continue  # Skip questions without answer key
+                valid_questions.append(q)
+        # Check for finals mode questions (identification)
+        elif mode == 'finals':
+            if all(key in q for key in ['id', 'question', 'answer']):
+                # Normalize to correct_answer for consistency
+                if 'answer' in q and 'correct_answer' not in q:
+                    q['correct_answer'] = q['answer']
+                valid_questions.append(q)
+        else:
+            raise ValueError(f"Invalid mode: {mode}")
+    
+    return {
+        'topic_name': topic_name,
+        'subtopic_name': subtopic_name,
+        'questions': tuple(valid_questions)
+    }
+
+
+@lru_cache(maxsize=4096)
+def _accepted_answers(correct_answer: str, alternatives: Tuple[str, ...]) -> frozenset:
+    """
+    Normalized set of accepted answers for an identification question
+    
+    Cached by answer key, so each question's answers are stripped and
+    lowercased once rather than on every submission.
+    
+    Args:
+        correct_answer: The question's answer
+        alternatives: Accepted alternative answers
+        
+    Returns:
+        Frozenset of stripped, lowercased accepted answers
+    """
+    return frozenset(answer.strip().lower() for answer in (correct_answer, *alternatives))
+
+
+def _load_data_file(path: Path, prepare=None):
+    """
+    Load a JSON data file, parsing it only on first use or after it changes
+    
+    The returned object is shared between callers and must not be mutated.
+    
+    Args:
+        path: Path to the JSON file
+        prepare: Optional callable applied once to freshly parsed data
+        
+    Returns:
+        Parsed JSON data
+    """
+    mtime = path.stat().st_mtime
+    cached = _data_file_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    
+    with _data_file_lock:
+        cached = _data_file_cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if prepare is not None:
+            data = prepare(data)
+        _data_file_cache[path] = (mtime, data)
+        return data
+
+
 class QuizService:
     """Service layer for quiz business logic"""
     
@@ -49,15 +205,14 @@ class QuizService:
         subtopic_name = subtopic.replace('_', ' ').title()  # default
         
         if topic_index_file.exists():
-            with open(topic_index_file, 'r', encoding='utf-8') as f:
-                topic_data = json.load(f)
-                topic_name = topic_data.get('topic_name', topic_name)
-                
-                # Find subtopic name in the subtopics list
-                for st in topic_data.get('subtopics', []):
-                    if st.get('id') == subtopic:
-                        subtopic_name = st.get('name', subtopic_name)
-                        break
+            topic_data = _load_data_file(topic_index_file)
+            topic_name = topic_data.get('topic_name', topic_name)
+            
+            # Find subtopic name in the subtopics list
+            for st in topic_data.get('subtopics', []):
+                if st.get('id') == subtopic:
+                    subtopic_name = st.get('name', subtopic_name)
+                    break
         
         # Construct path based on mode
         if mode == 'elimination':
@@ -70,53 +225,29 @@ class QuizService:
         if not questions_file.exists():
             raise ValueError(f"Questions file not found: {questions_file}")
         
-        with open(questions_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        bank = _load_data_file(
+            questions_file,
+            prepare=partial(_build_question_bank, mode=mode, source=questions_file)
+        )
         
-        # Extract questions from the data structure
-        if isinstance(data, dict) and 'questions' in data:
-            all_questions = data['questions']
-            # Override with metadata from question file if available
-            if 'topic_name' in data:
-                topic_name = data['topic_name']
-            if 'subtopic_name' in data:
-                subtopic_name = data['subtopic_name']
-        elif isinstance(data, list):
-            all_questions = data
-        else:
-            raise ValueError(f"Invalid questions file format: {questions_file}")
-        
-        # Validate questions have required fields
-        valid_questions = []
-        for q in all_questions:
-            # Add topic and subtopic metadata to each question
-            q['topic_name'] = topic_name
-            q['subtopic_name'] = subtopic_name
-            
-            # Check for elimination mode questions (multiple choice)
-            if mode == 'elimination':
-                if all(key in q for key in ['id', 'question', 'options']):
-                    # Normalize the correct answer field
-                    if 'correct' in q and 'correct_answer' not in q:
-                        q['correct_answer'] = q['correct']
-                    elif 'correct_answer' not in q and 'correct' not in q:
-                        continue  # Skip questions without answer key
-                    valid_questions.append(q)
-            # Check for finals mode questions (identification)
-            elif mode == 'finals':
-                if all(key in q for key in ['id', 'question', 'answer']):
-                    # Normalize to correct_answer for consistency
-                    if 'answer' in q and 'correct_answer' not in q:
-                        q['correct_answer'] = q['answer']
-                    valid_questions.append(q)
-            else:
-                raise ValueError(f"Invalid mode: {mode}")
+        # Override with metadata from question file if available
+        if bank['topic_name'] is not None:
+            topic_name = bank['topic_name']
+        if bank['subtopic_name'] is not None:
+            subtopic_name = bank['subtopic_name']
         
         # Randomly select questions
+        valid_questions = bank['questions']
         if len(valid_questions) < num_questions:
-            return valid_questions
+            selected = valid_questions
+        else:
+            selected = random.sample(valid_questions, num_questions)
         
-        return random.sample(valid_questions, num_questions)
+        # Copy before annotating; the bank is cached and shared
+        return [
+            {**q, 'topic_name': topic_name, 'subtopic_name': subtopic_name}
+            for q in selected
+        ]
     
     def create_elimination_quiz(
         self, 
@@ -248,20 +379,13 @@ class QuizService:
                 except (ValueError, TypeError):
                     is_correct = False
             elif quiz_type == 'finals':
-                # Identification: compare strings (case-insensitive)
-                user_ans_lower = str(user_answer).strip().lower()
-                correct_ans_lower = str(correct_answer).strip().lower()
-                
-                # Check if matches correct answer or any alternative
-                alternatives = question.get('alternatives', [])
-                is_correct = (user_ans_lower == correct_ans_lower)
-                
-                # Also check alternatives
-                if not is_correct and alternatives:
-                    for alt in alternatives:
-                        if user_ans_lower == str(alt).strip().lower():
-                            is_correct = True
-                            break
+                # Identification: compare strings (case-insensitive) against
+                # the correct answer or any alternative
+                accepted = _accepted_answers(
+                    str(correct_answer),
+                    tuple(str(alt) for alt in question.get('alternatives') or ())
+                )
+                is_correct = str(user_answer).strip().lower() in accepted
             else:
                 is_correct = str(user_answer) == str(correct_answer)
             
@@ -349,7 +473,7 @@ class QuizService:
             raise ValueError("Quiz session has expired")
         
         # Load questions from session
-        questions = json.loads(session.questions_json) if session.questions_json else []
+        questions = session.get_questions()
         
         # Calculate score
         results = self.calculate_score(questions, answers, session.quiz_type)
@@ -416,7 +540,7 @@ class QuizService:
         if not session:
             raise ValueError(f"Session not found: {session_id}")
         
-        return json.loads(session.questions_json) if session.questions_json else []
+        return session.get_questions()
     
     def validate_session(self, session_id: str) -> Tuple[bool, Optional[str]]:
         """
@@ -454,24 +578,35 @@ class QuizService:
         """
         Get list of available topics with metadata
         
+        The sorted catalog is built in one pass over the topic index files
+        and reused until a topic is added/removed or an index.json changes.
+        Each call returns a new list of shallow topic copies, so callers may
+        change top-level fields; nested values are shared and read-only.
+        
         Returns:
             List of topic dictionaries
         """
-        topics = []
+        global _topic_catalog
         
+        index_files = []
         for topic_dir in self.data_dir.iterdir():
-            if not topic_dir.is_dir():
-                continue
-            
             index_file = topic_dir / 'index.json'
-            if not index_file.exists():
+            try:
+                index_files.append((index_file, index_file.stat().st_mtime))
+            except (FileNotFoundError, NotADirectoryError):
                 continue
-            
-            with open(index_file, 'r', encoding='utf-8') as f:
-                topic_data = json.load(f)
-                topics.append(topic_data)
         
-        return sorted(topics, key=lambda x: x.get('title', ''))
+        signature = tuple(sorted(index_files))
+        catalog = _topic_catalog
+        if catalog is None or catalog[0] != signature:
+            with _topic_catalog_lock:
+                catalog = _topic_catalog
+                if catalog is None or catalog[0] != signature:
+                    topics = [_load_data_file(index_file) for index_file, _ in signature]
+                    catalog = (signature, sorted(topics, key=lambda x: x.get('title', '')))
+                    _topic_catalog = catalog
+        
+        return [dict(topic) for topic in catalog[1]]
     
     def get_subtopics(self, topic: str) -> List[Dict]:
         """
@@ -488,7 +623,4 @@ class QuizService:
         if not index_file.exists():
             raise ValueError(f"Topic not found: {topic}")
         
-        with open(index_file, 'r', encoding='utf-8') as f:
-            topic_data = json.load(f)
-        
-        return topic_data.get('subtopics', [])
+        return [dict(subtopic) for subtopic in _load_data_file(index_file).get('subtopics', [])]
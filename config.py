@@ -45,11 +45,12 @@ class Config:
     SQLALCHEMY_ECHO = False
     
     # SQLAlchemy Connection Pool Configuration
-    # Increase pool size to handle more concurrent connections
+    # Tune per deployment; keep (pool_size + max_overflow) x workers below
+    # the MySQL server's max_connections
     SQLALCHEMY_ENGINE_OPTIONS = {
-        'pool_size': 10,              # Number of connections to keep open
-        'max_overflow': 20,            # Additional connections when pool is full
-        'pool_timeout': 30,            # Seconds to wait for connection
+        'pool_size': int(os.getenv('DB_POOL_SIZE', 10)),        # Number of connections to keep open
+        'max_overflow': int(os.getenv('DB_MAX_OVERFLOW', 20)),  # Additional connections when pool is full
+        'pool_timeout': int(os.getenv('DB_POOL_TIMEOUT', 30)),  # Seconds to wait for connection
         'pool_recycle': 3600,          # Recycle connections after 1 hour
         'pool_pre_ping': True,         # Verify connections before using them
     }
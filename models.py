@@ -11,13 +11,54 @@ Updated to support the new repository pattern and service layer architecture.
 
 from datetime import datetime, timedelta
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy import Text
+from sqlalchemy import Text, text, inspect as sa_inspect
+from sqlalchemy.sql import expression
+from sqlalchemy.orm import reconstructor, deferred
 import json
+import operator
 import uuid
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
 db = SQLAlchemy()
 
 
+if orjson is not None:
+    def _dumps(obj):
+        """Serialize obj to a UTF-8 JSON string (orjson emits bytes)"""
+        return orjson.dumps(obj).decode('utf-8')
+
+    _loads = orjson.loads
+else:
+    def _dumps(obj):
+        """Serialize obj to a JSON string"""
+        return json.dumps(obj, ensure_ascii=False)
+
+    _loads = json.loads
+
+
+def _encode_json(value):
+    """
+    Serialize value for a JSON TEXT column
+    
+    Already-serialized payloads (str, or UTF-8 bytes) are stored as-is
+    instead of being encoded a second time.
+    """
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (bytes, bytearray)):
+        return value.decode('utf-8')
+    return _dumps(value)
+
+
+def _new_id():
+    """Generate a string UUID primary key"""
+    return str(uuid.uuid4())
+
+
 class QuizSession(db.Model):
     """
     Stores active quiz sessions (elimination and finals modes)
@@ -25,9 +66,10 @@ class QuizSession(db.Model):
     """
     __tablename__ = 'quiz_sessions'
     
-    id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = db.Column(db.String(36), primary_key=True, default=_new_id)
     quiz_type = db.Column(db.String(20), nullable=False)  # 'elimination' or 'finals'
-    questions_json = db.Column(Text, nullable=False)  # JSON string of questions
+    questions_json = deferred(db.Column(Text, nullable=False))  # JSON string of questions (loaded on access)
+    question_count = db.Column(db.Integer)  # Denormalized len(questions); NULL on rows from before the column
     
     # Quiz metadata
     topic = db.Column(db.String(100))  # Topic name
@@ -42,9 +84,11 @@ class QuizSession(db.Model):
     completed_at = db.Column(db.DateTime)  # When quiz was completed
     
     # Status
-    completed = db.Column(db.Boolean, default=False)
+    completed = db.Column(db.Boolean, nullable=False, default=False, server_default=expression.false())
     
     # Relationships
+    # The ORM cascade still deletes attempts: databases created before the FK
+    # gained ON DELETE CASCADE would otherwise reject deleting their sessions
     attempts = db.relationship('QuizAttempt', backref='session', lazy=True, cascade='all, delete-orphan')
     
     def __init__(self, quiz_type, questions, topic=None, subtopic=None, difficulty=None, 
@@ -54,7 +98,8 @@ class QuizSession(db.Model):
         
         Args:
             quiz_type: 'elimination' or 'finals'
-            questions: List of question dictionaries
+            questions: List of question dictionaries (or an already-serialized JSON
+                string, in which case question_count must be passed as well)
             topic: Topic name (optional)
             subtopic: Subtopic name (optional)
             difficulty: Difficulty level (optional)
@@ -62,28 +107,51 @@ class QuizSession(db.Model):
             time_limit: Time limit in seconds (optional)
             ttl_seconds: Time-to-live for session (default: 2 hours)
             **kwargs: Additional fields for flexibility
+            
+        Raises:
+            ValueError: If questions is serialized and question_count is missing
         """
-        self.id = str(uuid.uuid4())
+        if isinstance(questions, (str, bytes, bytearray)):
+            # Counting a serialized payload would mean decoding it again
+            if 'question_count' not in kwargs:
+                raise ValueError("question_count is required when questions is already serialized")
+        else:
+            self.question_count = len(questions)
+        self.id = _new_id()
         self.quiz_type = quiz_type
-        self.questions_json = json.dumps(questions, ensure_ascii=False)
+        self.questions_json = _encode_json(questions)
+        self._questions_cache = None
         self.topic = topic
         self.subtopic = subtopic
         self.difficulty = difficulty
         self.user_name = user_name
         self.time_limit = time_limit
-        self.created_at = datetime.utcnow()
-        self.expires_at = datetime.utcnow() + timedelta(seconds=ttl_seconds)
+        now = datetime.utcnow()
+        self.created_at = now
+        self.expires_at = now + timedelta(seconds=ttl_seconds)
         self.completed = False
         self.completed_at = None
         
         # Set any additional keyword arguments
         for key, value in kwargs.items():
-            if hasattr(self, key):
+            if key in self._settable:
                 setattr(self, key, value)
     
+    @reconstructor
+    def _init_on_load(self):
+        """Reset the parsed-questions cache when loaded from the database"""
+        self._questions_cache = None
+    
     def get_questions(self):
-        """Retrieve questions from JSON storage"""
-        return json.loads(self.questions_json) if self.questions_json else []
+        """
+        Retrieve questions from JSON storage
+        
+        The parsed list is cached on the instance, so repeated calls within
+        a request only decode questions_json once.
+        """
+        if self._questions_cache is None:
+            self._questions_cache = _loads(self.questions_json) if self.questions_json else []
+        return self._questions_cache
     
     def is_expired(self):
         """Check if session has expired"""
@@ -108,7 +176,8 @@ class QuizSession(db.Model):
             'expires_at': self.expires_at.isoformat(),
             'completed_at': self.completed_at.isoformat() if self.completed_at else None,
             'completed': self.completed,
-            'question_count': len(self.get_questions())
+            'question_count': (self.question_count if self.question_count is not None
+                               else len(self.get_questions()))
         }
 
 
@@ -118,9 +187,19 @@ class QuizAttempt(db.Model):
     Used for analytics and result tracking
     """
     __tablename__ = 'quiz_attempts'
+    __table_args__ = (
+        db.Index('ix_attempts_topic_diff_score', 'topic', 'difficulty', 'score'),  # Leaderboards
+        db.Index('ix_attempts_user_created', 'user_name', 'created_at'),  # Per-user history
+        db.Index('ix_attempts_session', 'session_id'),  # Session -> attempts join
+        db.Index('ix_attempts_created', 'created_at'),  # Time-bounded dashboards
+    )
     
-    id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    session_id = db.Column(db.String(36), db.ForeignKey('quiz_sessions.id'), nullable=False)
+    id = db.Column(db.String(36), primary_key=True, default=_new_id)
+    session_id = db.Column(
+        db.String(36),
+        db.ForeignKey('quiz_sessions.id', name='fk_attempts_session', ondelete='CASCADE'),
+        nullable=False
+    )
     
     # Quiz metadata
     quiz_type = db.Column(db.String(50))  # 'elimination', 'finals', 'review'
@@ -136,12 +215,17 @@ class QuizAttempt(db.Model):
     time_taken = db.Column(db.Integer)  # Time taken in seconds
     
     # Detailed answers (optional, for review functionality)
-    answers_json = db.Column(Text)  # JSON string of answer details
+    answers_json = deferred(db.Column(Text))  # JSON string of answer details (loaded on access)
     
     # Timestamps
     created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
     completed_at = db.Column(db.DateTime)
     
+    # Plain attributes copied as-is by to_dict(), fetched with one attrgetter call
+    _ATTEMPT_FIELDS = ('id', 'session_id', 'quiz_type', 'topic', 'subtopic', 'difficulty',
+                       'user_name', 'score', 'correct_count', 'incorrect_count')
+    _get_attempt_fields = operator.attrgetter(*_ATTEMPT_FIELDS)
+    
     def __init__(self, session_id, quiz_type, score, correct_count, incorrect_count,
                  topic=None, subtopic=None, difficulty=None, user_name=None, 
                  time_taken=None, answers=None, **kwargs):
@@ -162,7 +246,7 @@ class QuizAttempt(db.Model):
             answers: List of answer details (optional, for review)
             **kwargs: Additional fields for flexibility
         """
-        self.id = str(uuid.uuid4())
+        self.id = _new_id()
         self.session_id = session_id
         self.quiz_type = quiz_type
         self.topic = topic
@@ -173,13 +257,14 @@ class QuizAttempt(db.Model):
         self.correct_count = correct_count
         self.incorrect_count = incorrect_count
         self.time_taken = time_taken
-        self.answers_json = json.dumps(answers, ensure_ascii=False) if answers else None
-        self.created_at = datetime.utcnow()
-        self.completed_at = datetime.utcnow()
+        self.answers_json = _encode_json(answers) if answers else None
+        now = datetime.utcnow()
+        self.created_at = now
+        self.completed_at = now
         
         # Set any additional keyword arguments
         for key, value in kwargs.items():
-            if hasattr(self, key):
+            if key in self._settable:
                 setattr(self, key, value)
     
     @property
@@ -189,26 +274,17 @@ class QuizAttempt(db.Model):
     
     def get_answers(self):
         """Retrieve answer details from JSON storage"""
-        return json.loads(self.answers_json) if self.answers_json else []
+        return _loads(self.answers_json) if self.answers_json else []
     
     def to_dict(self):
         """Convert to dictionary"""
-        return {
-            'id': self.id,
-            'session_id': self.session_id,
-            'quiz_type': self.quiz_type,
-            'topic': self.topic,
-            'subtopic': self.subtopic,
-            'difficulty': self.difficulty,
-            'user_name': self.user_name,
-            'score': round(self.score, 2),
-            'correct_count': self.correct_count,
-            'incorrect_count': self.incorrect_count,
-            'total_questions': self.total_questions,
-            'time_taken': self.time_taken,
-            'created_at': self.created_at.isoformat(),
-            'completed_at': self.completed_at.isoformat() if self.completed_at else None
-        }
+        data = dict(zip(self._ATTEMPT_FIELDS, self._get_attempt_fields(self)))
+        data['score'] = round(self.score, 2)
+        data['total_questions'] = self.correct_count + self.incorrect_count
+        data['time_taken'] = self.time_taken
+        data['created_at'] = self.created_at.isoformat()
+        data['completed_at'] = self.completed_at.isoformat() if self.completed_at else None
+        return data
 
 
 class QuestionReport(db.Model):
@@ -217,8 +293,12 @@ class QuestionReport(db.Model):
     Helps identify problematic questions and track feedback
     """
     __tablename__ = 'question_reports'
+    __table_args__ = (
+        db.Index('ix_reports_status_created', 'status', 'created_at'),  # Admin inbox
+        db.Index('ix_reports_question', 'question_id'),  # Per-question aggregation
+    )
     
-    id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = db.Column(db.String(36), primary_key=True, default=_new_id)
     
     # Question identification
     question_id = db.Column(db.String(100), nullable=False)  # ID from question file
@@ -234,10 +314,10 @@ class QuestionReport(db.Model):
     
     # Question content (snapshot at time of report)
     question_text = db.Column(Text)  # The actual question
-    question_data_json = db.Column(Text)  # Full question data as JSON
+    question_data_json = deferred(db.Column(Text))  # Full question data as JSON (loaded on access)
     
     # Status tracking
-    status = db.Column(db.String(20), default='pending')  # pending, reviewed, resolved, dismissed
+    status = db.Column(db.String(20), default='pending', server_default='pending')  # pending, reviewed, resolved, dismissed
     admin_notes = db.Column(Text)  # Admin notes on the report
     reviewed_by = db.Column(db.String(100))  # Admin who reviewed
     reviewed_at = db.Column(db.DateTime)  # When reviewed
@@ -264,7 +344,7 @@ class QuestionReport(db.Model):
             question_data: Full question data dictionary
             **kwargs: Additional fields
         """
-        self.id = str(uuid.uuid4())
+        self.id = _new_id()
         self.question_id = question_id
         self.report_type = report_type
         self.reason = reason
@@ -274,18 +354,18 @@ class QuestionReport(db.Model):
         self.quiz_type = quiz_type
         self.difficulty = difficulty
         self.question_text = question_text
-        self.question_data_json = json.dumps(question_data, ensure_ascii=False) if question_data else None
+        self.question_data_json = _encode_json(question_data) if question_data else None
         self.status = 'pending'
         self.created_at = datetime.utcnow()
         
         # Set any additional keyword arguments
         for key, value in kwargs.items():
-            if hasattr(self, key):
+            if key in self._settable:
                 setattr(self, key, value)
     
     def get_question_data(self):
         """Retrieve question data from JSON storage"""
-        return json.loads(self.question_data_json) if self.question_data_json else {}
+        return _loads(self.question_data_json) if self.question_data_json else {}
     
     def mark_reviewed(self, admin_name, notes=None, status='reviewed'):
         """Mark report as reviewed"""
@@ -316,15 +396,52 @@ class QuestionReport(db.Model):
         }
 
 
+# Mapped attribute names accepted through **kwargs in the model constructors;
+# computed once instead of probing with hasattr() on every instantiation
+for _model in (QuizSession, QuizAttempt, QuestionReport):
+    _model._settable = frozenset(sa_inspect(_model).attrs.keys())
+del _model
+
+
 def init_db(app):
     """
     Initialize database with Flask app
     Creates tables if they don't exist
     
+    Connection pool settings from Config.SQLALCHEMY_ENGINE_OPTIONS are used
+    for any option the app has not configured itself, so standalone apps
+    (e.g. the scripts/ utilities) get the same pooling as the main app.
+    
     Args:
         app: Flask application instance
     """
+    from config import Config
+    
+    engine_options = app.config.setdefault('SQLALCHEMY_ENGINE_OPTIONS', {})
+    for key, value in Config.SQLALCHEMY_ENGINE_OPTIONS.items():
+        engine_options.setdefault(key, value)
+    
     db.init_app(app)
     
     with app.app_context():
-        db.create_all()
\ No newline at end of file
+        db.create_all()
+        upgrade_schema()
+
+
+def upgrade_schema():
+    """
+    Add columns introduced after the tables were first created
+    
+    db.create_all() never alters existing tables. Missing columns are added
+    as nullable; QuizSession.to_dict() counts the questions of rows whose
+    question_count is still NULL. Safe to run repeatedly. Must be called
+    inside an application context.
+    """
+    inspector = sa_inspect(db.engine)
+    if not inspector.has_table(QuizSession.__tablename__):
+        return
+    
+    columns = {column['name'] for column in inspector.get_columns(QuizSession.__tablename__)}
+    if 'question_count' not in columns:
+        with db.engine.begin() as conn:
+            conn.execute(text('ALTER TABLE quiz_sessions ADD COLUMN question_count INTEGER'))
\ No newline at end of file
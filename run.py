@@ -14,7 +14,7 @@ load_dotenv()
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from app import create_app
-from models import db
+from models import db, upgrade_schema
 from config import get_config
 
 # Determine environment
@@ -30,6 +30,7 @@ def init_database():
         with app.app_context():
             # Create all tables
             db.create_all()
+            upgrade_schema()
             print("✅ Database tables initialized successfully!")
     except Exception as e:
         print(f"⚠️  Warning: Could not initialize database tables: {e}")
@@ -6,8 +6,14 @@ Creates elimination and finals (easy, average, difficult) question files
 import os
 import sys
 import json
+import argparse
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the standard library
+    orjson = None
+
 # Add parent directory to path if needed
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
@@ -31,14 +37,39 @@ TOPICS = {
 
 def read_json(file_path):
     """Read JSON file"""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    with open(file_path, 'rb') as f:
+        raw = f.read()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
 def write_json(file_path, data):
-    """Write JSON file with proper formatting"""
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    """
+    Write JSON file with proper formatting
+
+    The file is left untouched if it already holds exactly this content,
+    so re-running the script does not rewrite unchanged files.
+
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        # json.dump() issues one write per token; serialize first, write once
+        payload = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+    try:
+        with open(file_path, 'rb') as f:
+            if f.read() == payload:
+                return False
+    except FileNotFoundError:
+        pass
+
+    with open(file_path, 'wb') as f:
+        f.write(payload)
+    return True
 
 
 def get_abbreviation(text):
@@ -189,9 +220,12 @@ def create_subtopic_files(topic_path, subtopic_info):
     
     elimination_data = create_placeholder_questions(subtopic_id, subtopic_name, "elimination")
     elimination_file = elimination_dir / f"{subtopic_id}.json"
-    write_json(elimination_file, elimination_data)
-    
-    print(f"  ✅ Created: elimination/{subtopic_id}.json (10 questions)")
+    files_written = 0
+    if write_json(elimination_file, elimination_data):
+        files_written += 1
+        print(f"  ✅ Created: elimination/{subtopic_id}.json (10 questions)")
+    else:
+        print(f"  ➖ Unchanged: elimination/{subtopic_id}.json")
     
     # Create finals folder structure with difficulty levels
     finals_dir = subtopic_dir / "finals"
@@ -204,15 +238,17 @@ def create_subtopic_files(topic_path, subtopic_info):
         
         finals_data = create_placeholder_questions(subtopic_id, subtopic_name, "finals", difficulty)
         finals_file = difficulty_dir / f"{subtopic_id}.json"
-        write_json(finals_file, finals_data)
-        
-        print(f"  ✅ Created: finals/{difficulty}/{subtopic_id}.json (10 questions)")
+        if write_json(finals_file, finals_data):
+            files_written += 1
+            print(f"  ✅ Created: finals/{difficulty}/{subtopic_id}.json (10 questions)")
+        else:
+            print(f"  ➖ Unchanged: finals/{difficulty}/{subtopic_id}.json")
     
-    print(f"\n✨ Total files created: 4 (1 elimination + 3 finals)")
-    print(f"✨ Total questions created: 40 (10 elimination + 30 finals)")
+    print(f"\n✨ Files written: {files_written} of 4 (1 elimination + 3 finals)")
+    print("✨ Questions per subtopic: 40 (10 elimination + 30 finals)")
 
 
-def update_index_file(topic_path, subtopic_info):
+def update_index_file(topic_path, subtopic_info, assume_yes=False):
     """Update the topic's index.json file"""
     index_path = topic_path / "index.json"
     
@@ -227,7 +263,7 @@ def update_index_file(topic_path, subtopic_info):
         existing_ids = [s["id"] for s in index_data.get("subtopics", [])]
         if subtopic_info["id"] in existing_ids:
             print(f"\n⚠️  Subtopic '{subtopic_info['id']}' already exists in index.json!")
-            overwrite = input("Do you want to overwrite it? (yes/no): ").strip().lower()
+            overwrite = "yes" if assume_yes else input("Do you want to overwrite it? (yes/no): ").strip().lower()
             if overwrite != "yes":
                 print("❌ Subtopic not added to index.json")
                 return False
@@ -245,9 +281,10 @@ def update_index_file(topic_path, subtopic_info):
         index_data["subtopics"].append(new_subtopic_entry)
         
         # Write updated index
-        write_json(index_path, index_data)
-        
-        print(f"\n✅ Updated index.json - added '{subtopic_info['name']}'")
+        if write_json(index_path, index_data):
+            print(f"\n✅ Updated index.json - added '{subtopic_info['name']}'")
+        else:
+            print(f"\n➖ index.json unchanged - '{subtopic_info['name']}' is already listed")
         print(f"   Total subtopics in {index_data['topic_name']}: {len(index_data['subtopics'])}")
         
         return True
@@ -257,8 +294,41 @@ def update_index_file(topic_path, subtopic_info):
         return False
 
 
-def main():
+def parse_args(argv=None):
+    """Parse optional command-line arguments for non-interactive use"""
+    topic_choices = sorted(TOPICS, key=int) + sorted(topic["id"] for topic in TOPICS.values())
+    parser = argparse.ArgumentParser(description="Add a new subtopic with placeholder questions")
+    parser.add_argument("--topic", choices=topic_choices, help="Topic number or ID")
+    parser.add_argument("--id", dest="subtopic_id", help="Subtopic ID (e.g. 'new_concept')")
+    parser.add_argument("--name", dest="subtopic_name", help="Subtopic name (e.g. 'New Concept')")
+    parser.add_argument("--description", default="", help="Subtopic description")
+    parser.add_argument("--yes", action="store_true", help="Skip confirmation prompts")
+    args = parser.parse_args(argv)
+    
+    # Same rules as get_subtopic_info(): both values are required and non-empty
+    if args.subtopic_id is not None or args.subtopic_name is not None:
+        if args.subtopic_id is None or args.subtopic_name is None:
+            parser.error("--id and --name must be given together")
+        args.subtopic_id = args.subtopic_id.strip().lower().replace(" ", "_")
+        args.subtopic_name = args.subtopic_name.strip()
+        if not args.subtopic_id:
+            parser.error("--id cannot be empty")
+        if not args.subtopic_name:
+            parser.error("--name cannot be empty")
+    return args
+
+
+def find_topic(key):
+    """Look up a topic by menu number or topic ID"""
+    if key in TOPICS:
+        return TOPICS[key]
+    return next((topic for topic in TOPICS.values() if topic["id"] == key), None)
+
+
+def main(argv=None):
     """Main execution function"""
+    args = parse_args(argv)
+    
     print("="*70)
     print("IT-QUIZBEE: ADD NEW SUBTOPIC")
     print("="*70)
@@ -273,8 +343,11 @@ def main():
         return
     
     # Display and select topic
-    display_topics()
-    topic = get_topic_choice()
+    if args.topic:
+        topic = find_topic(args.topic)
+    else:
+        display_topics()
+        topic = get_topic_choice()
     
     if topic is None:
         print("\n👋 Goodbye!")
@@ -289,7 +362,14 @@ def main():
     print(f"\n✅ Selected topic: {topic['name']}")
     
     # Get subtopic information
-    subtopic_info = get_subtopic_info()
+    if args.subtopic_id:
+        subtopic_info = {
+            "id": args.subtopic_id,
+            "name": args.subtopic_name,
+            "description": args.description.strip() or f"Questions about {args.subtopic_name}"
+        }
+    else:
+        subtopic_info = get_subtopic_info()
     
     # Show summary and confirm
     print("\n" + "="*70)
@@ -307,7 +387,7 @@ def main():
     print(f"  • {topic['id']}/{subtopic_info['id']}/finals/difficult/{subtopic_info['id']}.json")
     print("="*70)
     
-    confirm = input("\nProceed with creation? (yes/no): ").strip().lower()
+    confirm = "yes" if args.yes else input("\nProceed with creation? (yes/no): ").strip().lower()
     
     if confirm != "yes":
         print("\n❌ Operation cancelled.")
@@ -319,7 +399,7 @@ def main():
     
     # Update index.json
     print("\n📝 Updating index.json...")
-    update_index_file(topic_path, subtopic_info)
+    update_index_file(topic_path, subtopic_info, assume_yes=args.yes)
     
     # Final message
     print("\n" + "="*70)
@@ -35,6 +35,8 @@ def create_app():
     app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
         'pool_pre_ping': True,
         'pool_recycle': 3600,
+        'pool_size': 1,         # Single-threaded script: one connection is enough
+        'max_overflow': 0,
         'echo': False
     }
     
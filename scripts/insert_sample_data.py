@@ -6,15 +6,22 @@ Creates realistic quiz attempts using actual questions from the data folder
 import os
 import sys
 import random
+import argparse
 import json
 from pathlib import Path
 from datetime import datetime, timedelta
-from dotenv import load_dotenv
-from flask import Flask
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the standard library
+    orjson = None
 
 # Add parent directory to path to import models
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-from models import db, QuizSession, QuizAttempt, QuestionReport, init_db
+
+# Flask, SQLAlchemy and the models are imported where they are used so the
+# script starts (and reports configuration errors) without loading them up front
 
 # Sample user names for testing
 SAMPLE_NAMES = [
@@ -24,12 +31,81 @@ SAMPLE_NAMES = [
     'Jennifer Harris', 'Michael Martin', 'Lisa Thompson', 'William Garcia', 'Mary Robinson'
 ]
 
-# Load environment variables
-load_dotenv()
+# Sample timestamps fall on days 0-30 before now, at any hour and minute
+MINUTES_PER_DAY = 24 * 60
+MINUTES_IN_RANGE = 31 * MINUTES_PER_DAY
+
+# Question report vocabulary (built once, shared by every generated report)
+REPORT_TYPES = ('incorrect_answer', 'unclear_question', 'typo', 'outdated_info', 'other')
+CORRECT_ANSWER_REPORT_TYPES = ('typo', 'unclear_question', 'outdated_info')
+REPORT_STATUSES = ('pending', 'reviewed', 'resolved', 'dismissed')
+REPORT_STATUS_WEIGHTS = (0.4, 0.3, 0.2, 0.1)  # 40% pending, 30% reviewed, 20% resolved, 10% dismissed
+OPTION_LETTERS = ('A', 'B', 'C', 'D')
+
+# Realistic reasons per report type
+REASON_TEMPLATES = {
+    'incorrect_answer': (
+        "The correct answer seems wrong. I believe option {alt} is correct.",
+        "Multiple options could be correct. Please clarify.",
+        "The explanation contradicts the marked correct answer."
+    ),
+    'unclear_question': (
+        "The question wording is confusing and ambiguous.",
+        "Question lacks context to determine the correct answer.",
+        "The question could be interpreted in multiple ways."
+    ),
+    'typo': (
+        "There's a spelling mistake in the question.",
+        "Grammar error makes the question unclear.",
+        "Formatting issue in one of the options."
+    ),
+    'outdated_info': (
+        "The information in this question is outdated.",
+        "This technology/standard has been updated since this question was written.",
+        "Current best practices differ from what's stated."
+    ),
+    'other': (
+        "This question seems out of scope for the topic.",
+        "Question difficulty doesn't match the indicated level.",
+        "Similar question appears multiple times in the quiz."
+    )
+}
+DEFAULT_REASONS = ("Sample report issue",)
+
+# Admin notes per review outcome
+ADMIN_NOTES = {
+    'resolved': (
+        'Fixed the error in question data. Updated correct answer.',
+        'Corrected typo and updated question text.',
+        'Updated question with current information.',
+        'Clarified question wording based on feedback.'
+    ),
+    'reviewed': (
+        'Under review. Checking with subject matter expert.',
+        'Investigating the reported issue.',
+        'Needs verification before making changes.'
+    ),
+    'dismissed': (
+        'Question is correct as written. Explanation added.',
+        'Unable to reproduce the reported issue.',
+        'Report appears to be based on misunderstanding.'
+    )
+}
 
 # Get data directory
 DATA_DIR = Path(__file__).parent.parent / 'data'
 
+def load_json(raw):
+    """Parse a JSON document given as str or bytes"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def read_json(file_path):
+    """Read a JSON data file"""
+    with open(file_path, 'rb') as f:
+        return load_json(f.read())
+
 def get_available_topics():
     """Get list of available topics from data directory"""
     topics = []
@@ -37,27 +113,36 @@ def get_available_topics():
         if topic_dir.is_dir() and not topic_dir.name.startswith('.'):
             index_file = topic_dir / 'index.json'
             if index_file.exists():
-                with open(index_file, 'r', encoding='utf-8') as f:
-                    topic_data = json.load(f)
-                    topics.append({
-                        'id': topic_dir.name,
-                        'name': topic_data.get('topic_name', topic_dir.name),
-                        'subtopics': topic_data.get('subtopics', [])
-                    })
+                topic_data = read_json(index_file)
+                topics.append({
+                    'id': topic_dir.name,
+                    'name': topic_data.get('topic_name', topic_dir.name),
+                    'subtopics': topic_data.get('subtopics', [])
+                })
     return topics
 
-def load_real_questions(topic_id, subtopic_id, mode='elimination', difficulty='average', count=100):
-    """Load real questions from data directory"""
+@lru_cache(maxsize=None)
+def read_questions_file(topic_id, subtopic_id, mode, difficulty):
+    """
+    Parse one question file and tag each question with its metadata
+    
+    Cached per file: the initial scan and the review quizzes ask for the
+    same files repeatedly, and each is read and parsed only once. The cached
+    dicts are shared, so callers get copies through load_real_questions().
+    
+    Returns:
+        Tuple of question dicts (empty if the file is missing, is not valid
+        JSON, or has no question list)
+    """
     if mode == 'elimination':
         questions_file = DATA_DIR / topic_id / subtopic_id / 'elimination' / f'{subtopic_id}.json'
     else:  # finals
         questions_file = DATA_DIR / topic_id / subtopic_id / 'finals' / difficulty / f'{subtopic_id}.json'
     
-    if not questions_file.exists():
-        return []
-    
-    with open(questions_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    try:
+        data = read_json(questions_file)
+    except (FileNotFoundError, ValueError):  # JSON decode errors are ValueErrors
+        return ()
     
     # Extract questions from the data structure
     if isinstance(data, dict) and 'questions' in data:
@@ -65,7 +150,7 @@ def load_real_questions(topic_id, subtopic_id, mode='elimination', difficulty='a
     elif isinstance(data, list):
         questions = data
     else:
-        return []
+        return ()
     
     # Add metadata to each question
     for q in questions:
@@ -76,15 +161,30 @@ def load_real_questions(topic_id, subtopic_id, mode='elimination', difficulty='a
         if mode == 'finals' and 'difficulty' not in q:
             q['difficulty'] = difficulty
     
-    # Return random sample
-    if len(questions) <= count:
-        return questions
-    return random.sample(questions, count)
+    return tuple(questions)
+
+def load_real_questions(topic_id, subtopic_id, mode='elimination', difficulty='average', count=100, rng=random):
+    """Load real questions from data directory (rng: random.Random or the random module)"""
+    if mode == 'elimination':
+        difficulty = None  # Elimination files have no difficulty level; share one cache entry
+    questions = read_questions_file(topic_id, subtopic_id, mode, difficulty)
+    
+    # Return random sample (copies, so the cached questions stay untouched)
+    if len(questions) > count:
+        questions = rng.sample(questions, count)
+    return [dict(q) for q in questions]
 
 def create_app():
     """Create Flask app for database operations"""
+    from dotenv import load_dotenv
+    from flask import Flask
+    
+    # Load environment variables
+    load_dotenv()
+    
+    # Only used for its application context; no requests or sessions are
+    # served, so no secret key is configured
     app = Flask(__name__)
-    app.secret_key = os.environ.get('SECRET_KEY', 'dev-secret-key-change-in-production')
     
     # Configure MySQL database connection
     mysql_url = os.environ.get('MYSQL_PUBLIC_URL')
@@ -99,34 +199,54 @@ def create_app():
     app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
         'pool_pre_ping': True,
         'pool_recycle': 3600,
+        'pool_size': 1,         # Single-threaded script: one connection is enough
+        'max_overflow': 0,
         'echo': False
     }
     
     return app
 
-def generate_sample_answers(questions, mode='elimination', score_range=(50, 100)):
-    """Generate sample answers based on a desired score range"""
-    total = len(questions)
+def sample_correct_count(total, score_range, rng=random):
+    """Pick a number of correct answers out of total within a score range (percent)"""
     min_correct = int(total * score_range[0] / 100)
     max_correct = int(total * score_range[1] / 100)
-    correct_count = random.randint(min_correct, max_correct)
+    return rng.randint(min_correct, max_correct)
+
+def generate_sample_answers(questions, mode='elimination', score_range=(50, 100), rng=random):
+    """Generate sample answers based on a desired score range (rng: random.Random or the random module)"""
+    total = len(questions)
+    correct_count = sample_correct_count(total, score_range, rng)
     
-    # Randomly select which questions to get correct
-    correct_indices = random.sample(range(total), correct_count)
+    # Randomly select which questions to get correct (mask gives O(1) lookups).
+    # Scores are usually above 50%, so sample whichever side is smaller.
+    if correct_count > total // 2:
+        correct_mask = [True] * total
+        for index in rng.sample(range(total), total - correct_count):
+            correct_mask[index] = False
+    else:
+        correct_mask = [False] * total
+        for index in rng.sample(range(total), correct_count):
+            correct_mask[index] = True
+    
+    # The mode is fixed for the whole quiz, so decide the answer shape once
+    is_elimination = mode in ('elimination', 'elimination_full')
     
     answers = []
+    append = answers.append
     for i, question in enumerate(questions):
-        is_correct = i in correct_indices
+        is_correct = correct_mask[i]
         
         # Get question_id from question data (required for analytics)
         question_id = question.get('id', f'q_{i}')
         
-        if mode in ['elimination', 'elimination_full']:
-            user_answer = question['correct'] if is_correct else random.choice([
-                x for x in range(4) if x != question['correct']
-            ])
+        if is_elimination:
+            if is_correct:
+                user_answer = question['correct']
+            else:
+                # Uniform over the three wrong options: offset 1-3 from the correct one
+                user_answer = (question['correct'] + rng.randint(1, 3)) % 4
             
-            answers.append({
+            append({
                 'question_id': question_id,  # Required for question analytics
                 'question': question['question'],
                 'options': question['options'],
@@ -141,7 +261,7 @@ def generate_sample_answers(questions, mode='elimination', score_range=(50, 100)
         else:  # finals
             user_answer = question['answer'] if is_correct else f'Wrong Answer {i}'
             
-            answers.append({
+            append({
                 'question_id': question_id,  # Required for question analytics
                 'question': question['question'],
                 'user_answer': user_answer,
@@ -155,20 +275,264 @@ def generate_sample_answers(questions, mode='elimination', score_range=(50, 100)
     
     return answers, correct_count
 
-def insert_sample_data():
-    """Insert comprehensive sample data for testing"""
+def random_created_at(end_date, rng=random):
+    """
+    Pick a random timestamp (to the minute) within the 30 days before end_date
+    
+    One draw over the whole minute range replaces separate day, hour and
+    minute draws; the distribution is the same.
+    
+    Returns:
+        Tuple of (created_at, days_ago)
+    """
+    minutes_ago = rng.randrange(MINUTES_IN_RANGE)
+    return end_date - timedelta(minutes=minutes_ago), minutes_ago // MINUTES_PER_DAY
+
+def random_created_ats(end_date, count, rng=random):
+    """
+    Batch version of random_created_at() for count timestamps
+    
+    Draws every minute offset in a single rng.choices() call.
+    
+    Returns:
+        List of (created_at, days_ago) tuples
+    """
+    return [
+        (end_date - timedelta(minutes=minutes_ago), minutes_ago // MINUTES_PER_DAY)
+        for minutes_ago in rng.choices(range(MINUTES_IN_RANGE), k=count)
+    ]
+
+def is_sample_id(column):
+    """Sample row predicate (a constant-prefix LIKE, so it still uses the index)"""
+    return column.like('sample-%')
+
+def dump_json(value):
+    """Serialize a questions/answers payload for a JSON TEXT column"""
+    if orjson is not None:
+        return orjson.dumps(value).decode('utf-8')
+    return json.dumps(value, ensure_ascii=False)
+
+def session_row(session_id, quiz_type, questions, created_at, ttl_seconds, **fields):
+    """
+    Build a quiz_sessions row for bulk insertion
+    
+    Rows are inserted without QuizSession.__init__, so the JSON payload and
+    the denormalized question count are filled in here.
+    """
+    return dict(
+        id=session_id,
+        quiz_type=quiz_type,
+        questions_json=dump_json(questions),
+        question_count=len(questions),
+        created_at=created_at,
+        expires_at=created_at + timedelta(seconds=ttl_seconds),
+        completed=True,
+        **fields
+    )
+
+def attempt_row(session_id, quiz_type, score, created_at, time_taken, answers, **fields):
+    """Build a quiz_attempts row for bulk insertion (id comes from the column default)"""
+    return dict(
+        session_id=session_id,
+        quiz_type=quiz_type,
+        score=round(score, 2),
+        created_at=created_at,
+        completed_at=created_at + timedelta(seconds=time_taken),
+        time_taken=time_taken,
+        answers_json=dump_json(answers) if answers else None,
+        **fields
+    )
+
+def report_row(report_id, question_id, report_type, reason, created_at, question_data,
+               status='pending', reviewed_by=None, reviewed_at=None, admin_notes=None, **fields):
+    """Build a question_reports row for bulk insertion"""
+    return dict(
+        id=report_id,
+        question_id=question_id,
+        report_type=report_type,
+        reason=reason,
+        created_at=created_at,
+        question_data_json=dump_json(question_data),
+        status=status,
+        reviewed_by=reviewed_by,
+        reviewed_at=reviewed_at,
+        admin_notes=admin_notes,
+        **fields
+    )
+
+def insert_rows(session_rows, attempt_rows):
+    """
+    Bulk-insert the generated session and attempt rows
+    
+    Rows go out as Core executemany INSERTs on the ORM session's own
+    connection: one pooled connection and one transaction for the whole
+    run, and queries made later through db.session see the rows. Sessions
+    go first so every attempt's foreign key is satisfied. Nothing is
+    committed here.
+    """
+    from models import db, QuizSession, QuizAttempt
+    
+    conn = db.session.connection()
+    if session_rows:
+        conn.execute(QuizSession.__table__.insert(), session_rows)
+    if attempt_rows:
+        conn.execute(QuizAttempt.__table__.insert(), attempt_rows)
+
+def pick_elimination_quiz(pools, i, rng):
+    """Full elimination quiz: 100 questions drawn from every topic"""
+    all_elim_questions = pools['elimination']
+    if len(all_elim_questions) >= 100:
+        questions = rng.sample(all_elim_questions, 100)
+    else:
+        questions = all_elim_questions
+    
+    return {
+        'session_id': f'sample-elim-{i:04d}',
+        'questions': questions,
+        'answer_mode': 'elimination_full',
+        'attempt_type': 'elimination',
+        'topic': 'all_topics',
+        'subtopic': None,
+        'session_difficulty': 'mixed',
+        'attempt_difficulty': 'mixed'
+    }
+
+def pick_finals_quiz(pools, i, rng):
+    """Full finals quiz: 30 questions (10 easy, 10 average, 10 difficult)"""
+    all_finals_questions = pools['finals']
+    questions = []
+    for diff, q_list in all_finals_questions.items():
+        if len(q_list) >= 10:
+            questions.extend(rng.sample(q_list, 10))
+        else:
+            questions.extend(q_list)
+    
+    # If we don't have enough, fill from what we have
+    if len(questions) < 30:
+        all_q = all_finals_questions['easy'] + all_finals_questions['average'] + all_finals_questions['difficult']
+        if len(all_q) >= 30:
+            questions = rng.sample(all_q, 30)
+        else:
+            questions = all_q
+    
+    return {
+        'session_id': f'sample-finals-{i:04d}',
+        'questions': questions,
+        'answer_mode': 'finals_full',
+        'attempt_type': 'finals',
+        'topic': 'all_topics',
+        'subtopic': None,
+        'session_difficulty': 'mixed',
+        # Randomly assign difficulty to the attempt
+        'attempt_difficulty': rng.choice(['easy', 'average', 'difficult'])
+    }
+
+def pick_review_quiz(pools, i, rng):
+    """Review quiz: 10 questions from one random subtopic, mode and difficulty"""
+    # Randomly select mode and difficulty for this review attempt
+    mode = rng.choice(['elimination', 'finals'])
+    difficulty = rng.choice(['easy', 'average', 'difficult'])
+    
+    # Randomly select a topic and subtopic
+    topic = rng.choice(pools['topics'])
+    subtopic = rng.choice(topic['subtopics'])
+    
+    # Load real questions for this review
+    questions = load_real_questions(
+        topic['id'], 
+        subtopic['id'], 
+        mode, 
+        difficulty if mode == 'finals' else 'average',
+        count=10,
+        rng=rng
+    )
+    if not questions:
+        return None
+    
+    # Shorter session ID to avoid database length limit
+    mode_short = 'e' if mode == 'elimination' else 'f'  # e or f
+    diff_short = difficulty[0]  # e, a, or d
+    review_difficulty = difficulty if mode == 'finals' else None
+    
+    return {
+        'session_id': f'sample-r{mode_short}{diff_short}-{i:04d}',
+        'questions': questions,
+        'answer_mode': mode,
+        # Quiz mode label that distinguishes mode and difficulty
+        'attempt_type': f'review_{mode}',
+        'topic': topic['id'],
+        'subtopic': subtopic['id'],
+        'session_difficulty': review_difficulty,
+        'attempt_difficulty': review_difficulty
+    }
+
+# One entry per generated quiz mode. score_ranges are for attempts older
+# than 20 days, older than 10 days, and more recent ones. score_total is the
+# fixed question count a full quiz is scored against (None: the number of
+# questions actually picked).
+SAMPLE_QUIZ_CONFIGS = (
+    {
+        'name': 'elimination',
+        'label': 'Elimination Mode',
+        'count_range': (60, 80),
+        'session_type': 'elimination',
+        'ttl': 7200,
+        'time_range': (1800, 3600),  # 30-60 minutes
+        'score_ranges': ((40, 70), (60, 80), (70, 95)),
+        'score_total': 100,
+        'pick': pick_elimination_quiz
+    },
+    {
+        'name': 'finals',
+        'label': 'Finals Mode',
+        'count_range': (40, 60),
+        'session_type': 'finals',
+        'ttl': 7200,
+        'time_range': (900, 1800),  # 15-30 minutes
+        'score_ranges': ((50, 75), (65, 85), (75, 95)),  # Finals typically have higher scores
+        'score_total': 30,
+        'pick': pick_finals_quiz
+    },
+    {
+        'name': 'review',
+        'label': 'Review Mode',
+        'count_range': (20, 30),
+        'session_type': 'review',
+        'ttl': 3600,
+        'time_range': (300, 900),  # 5-15 minutes
+        'score_ranges': ((60, 90),) * 3,  # Review mode typically has moderate scores
+        'score_total': None,
+        'pick': pick_review_quiz
+    }
+)
+
+def insert_sample_data(include_answers=True):
+    """
+    Insert comprehensive sample data for testing
+    
+    Args:
+        include_answers: Store per-question answers on each attempt. Without
+            them attempts only carry scores and counts, which is enough for
+            the dashboard, but question analytics and question reports have
+            nothing to work from.
+    """
     print("="*70)
     print("IT-QUIZBEE: Insert Sample Data for Admin Dashboard")
     print("="*70)
     print()
     
+    from models import db, QuizSession, QuizAttempt, QuestionReport, init_db
+    
     app = create_app()
     init_db(app)
     
+    # One generator instance shared by every helper below
+    rng = random.Random()
+    
     with app.app_context():
-        # Check if sample data already exists
-        existing_sample = QuizSession.query.filter(
-            QuizSession.id.like('sample-%')
+        # Check if sample data already exists (primary key only, no row data)
+        existing_sample = db.session.query(QuizSession.id).filter(
+            is_sample_id(QuizSession.id)
         ).first()
         
         if existing_sample:
@@ -180,19 +544,34 @@ def insert_sample_data():
             
             # Remove existing sample data
             print("\n🗑️  Removing existing sample data...")
-            # Delete in correct order: reports → attempts → sessions
-            QuestionReport.query.filter(QuestionReport.id.like('sample-%')).delete(synchronize_session=False)
-            QuizAttempt.query.filter(QuizAttempt.session_id.like('sample-%')).delete(synchronize_session=False)
-            QuizSession.query.filter(QuizSession.id.like('sample-%')).delete(synchronize_session=False)
+            # Delete in correct order: reports → attempts → sessions, as plain
+            # Core statements in one transaction (no ORM query compilation)
+            from sqlalchemy import delete
+            
+            for table, column in (
+                (QuestionReport.__table__, QuestionReport.__table__.c.id),
+                (QuizAttempt.__table__, QuizAttempt.__table__.c.session_id),
+                (QuizSession.__table__, QuizSession.__table__.c.id)
+            ):
+                db.session.execute(delete(table).where(is_sample_id(column)))
             db.session.commit()
             print("✅ Existing sample data removed.")
         
+        # Everything below is written with explicit bulk inserts and committed
+        # once at the end; no query needs pending objects flushed first
+        db.session.autoflush = False
+        
         print("\n🚀 Creating sample data...")
         print()
         
         total_sessions = 0
         total_attempts = 0
         
+        # Rows are collected as plain dicts and inserted with one executemany
+        # per table instead of adding ORM objects one by one
+        session_rows = []
+        attempt_rows = []
+        
         # Generate data over the last 30 days
         end_date = datetime.now()
         start_date = end_date - timedelta(days=30)
@@ -212,282 +591,119 @@ def insert_sample_data():
         for topic in topics:
             for subtopic in topic['subtopics']:
                 # Load elimination questions
-                elim_qs = load_real_questions(topic['id'], subtopic['id'], 'elimination', count=200)
+                elim_qs = load_real_questions(topic['id'], subtopic['id'], 'elimination', count=200, rng=rng)
                 all_elim_questions.extend(elim_qs)
                 
                 # Load finals questions by difficulty
                 for diff in ['easy', 'average', 'difficult']:
-                    finals_qs = load_real_questions(topic['id'], subtopic['id'], 'finals', diff, count=50)
+                    finals_qs = load_real_questions(topic['id'], subtopic['id'], 'finals', diff, count=50, rng=rng)
                     all_finals_questions[diff].extend(finals_qs)
         
         print(f"   📊 Loaded {len(all_elim_questions)} elimination questions")
         print(f"   📊 Loaded {len(all_finals_questions['easy'])} easy, {len(all_finals_questions['average'])} average, {len(all_finals_questions['difficult'])} difficult finals questions")
         
-        # 1. Create Elimination Mode attempts (60-80 attempts)
-        print("\n📝 Creating Elimination Mode attempts...")
-        elimination_count = random.randint(60, 80)
+        # 1-3. Create Elimination, Finals and Review Mode attempts
+        pools = {
+            'topics': topics,
+            'elimination': all_elim_questions,
+            'finals': all_finals_questions
+        }
+        created_counts = {}
+        print()
         
-        for i in range(elimination_count):
-            # Random date within last 30 days
-            days_ago = random.randint(0, 30)
-            created_at = end_date - timedelta(
-                days=days_ago,
-                hours=random.randint(0, 23),
-                minutes=random.randint(0, 59)
-            )
-            
-            # Create session
-            # Use real questions from all topics
-            if len(all_elim_questions) >= 100:
-                questions = random.sample(all_elim_questions, 100)
-            else:
-                questions = all_elim_questions
+        for cfg in SAMPLE_QUIZ_CONFIGS:
+            print(f"📝 Creating {cfg['label']} attempts...")
+            count = rng.randint(*cfg['count_range'])
+            
+            # Draw dates (within the last 30 days), names and durations
+            # for the whole mode up front
+            created_ats = random_created_ats(end_date, count, rng)
+            session_names = rng.choices(SAMPLE_NAMES, k=count)
+            attempt_names = rng.choices(SAMPLE_NAMES, k=count)
+            min_time, max_time = cfg['time_range']
+            times_taken = rng.choices(range(min_time, max_time + 1), k=count)
+            
+            for i in range(count):
+                created_at, days_ago = created_ats[i]
                 
-            session = QuizSession(
-                quiz_type='elimination',
-                questions=questions,
-                topic='all_topics',
-                difficulty='mixed',
-                user_name=random.choice(SAMPLE_NAMES),
-                ttl_seconds=7200
-            )
-            session.id = f'sample-elim-{i:04d}'
-            session.created_at = created_at
-            session.expires_at = created_at + timedelta(seconds=7200)
-            session.completed = True
-            
-            db.session.add(session)
-            
-            # Create attempt with varying scores
-            # Earlier attempts have lower scores (learning curve)
-            if days_ago > 20:
-                score_range = (40, 70)  # Lower scores for older attempts
-            elif days_ago > 10:
-                score_range = (60, 80)  # Medium scores
-            else:
-                score_range = (70, 95)  # Higher scores for recent attempts
-            
-            answers, correct_count = generate_sample_answers(
-                questions, 'elimination_full', score_range
-            )
-            
-            incorrect_count = 100 - correct_count
-            score = (correct_count / 100) * 100
-            time_taken = random.randint(1800, 3600)  # 30-60 minutes
-            
-            attempt = QuizAttempt(
-                session_id=session.id,
-                quiz_type='elimination',
-                score=score,
-                correct_count=correct_count,
-                incorrect_count=incorrect_count,
-                topic='all_topics',
-                difficulty='mixed',
-                user_name=random.choice(SAMPLE_NAMES),
-                time_taken=time_taken,
-                answers=answers
-            )
-            attempt.created_at = created_at
-            attempt.completed_at = created_at + timedelta(seconds=time_taken)
-            
-            db.session.add(attempt)
-            total_sessions += 1
-            total_attempts += 1
-        
-        print(f"   ✅ Created {elimination_count} elimination attempts")
-        
-        # 2. Create Finals Mode attempts (40-60 attempts)
-        print("📝 Creating Finals Mode attempts...")
-        finals_count = random.randint(40, 60)
-        
-        for i in range(finals_count):
-            days_ago = random.randint(0, 30)
-            created_at = end_date - timedelta(
-                days=days_ago,
-                hours=random.randint(0, 23),
-                minutes=random.randint(0, 59)
-            )
-            
-            # Create session with 30 questions (10 easy, 10 average, 10 difficult)
-            questions = []
-            for diff, q_list in all_finals_questions.items():
-                if len(q_list) >= 10:
-                    questions.extend(random.sample(q_list, 10))
+                spec = cfg['pick'](pools, i, rng)
+                
+                # Skip if no questions available
+                if spec is None:
+                    continue
+                
+                questions = spec['questions']
+                session_id = spec['session_id']
+                session_rows.append(session_row(
+                    session_id, cfg['session_type'], questions, created_at, cfg['ttl'],
+                    topic=spec['topic'],
+                    subtopic=spec['subtopic'],
+                    difficulty=spec['session_difficulty'],
+                    user_name=session_names[i]
+                ))
+                
+                # Earlier attempts have lower scores (learning curve)
+                if days_ago > 20:
+                    score_range = cfg['score_ranges'][0]
+                elif days_ago > 10:
+                    score_range = cfg['score_ranges'][1]
                 else:
-                    questions.extend(q_list)
-            
-            # If we don't have enough, fill from what we have
-            if len(questions) < 30:
-                all_q = all_finals_questions['easy'] + all_finals_questions['average'] + all_finals_questions['difficult']
-                if len(all_q) >= 30:
-                    questions = random.sample(all_q, 30)
+                    score_range = cfg['score_ranges'][2]
+                
+                if include_answers:
+                    answers, correct_count = generate_sample_answers(
+                        questions, spec['answer_mode'], score_range, rng
+                    )
                 else:
-                    questions = all_q
-                    
-            session = QuizSession(
-                quiz_type='finals',
-                questions=questions,
-                topic='all_topics',
-                difficulty='mixed',
-                user_name=random.choice(SAMPLE_NAMES),
-                ttl_seconds=7200
-            )
-            session.id = f'sample-finals-{i:04d}'
-            session.created_at = created_at
-            session.expires_at = created_at + timedelta(seconds=7200)
-            session.completed = True
-            
-            db.session.add(session)
-            
-            # Finals typically have higher scores
-            if days_ago > 20:
-                score_range = (50, 75)
-            elif days_ago > 10:
-                score_range = (65, 85)
-            else:
-                score_range = (75, 95)
-            
-            answers, correct_count = generate_sample_answers(
-                questions, 'finals_full', score_range
-            )
-            
-            # Randomly assign difficulty to the attempt
-            difficulty = random.choice(['easy', 'average', 'difficult'])
-            
-            incorrect_count = 30 - correct_count
-            score = (correct_count / 30) * 100
-            time_taken = random.randint(900, 1800)  # 15-30 minutes
-            
-            attempt = QuizAttempt(
-                session_id=session.id,
-                quiz_type='finals',
-                score=score,
-                correct_count=correct_count,
-                incorrect_count=incorrect_count,
-                topic='all_topics',
-                difficulty=difficulty,
-                user_name=random.choice(SAMPLE_NAMES),
-                time_taken=time_taken,
-                answers=answers
-            )
-            attempt.created_at = created_at
-            attempt.completed_at = created_at + timedelta(seconds=time_taken)
-            
-            db.session.add(attempt)
-            total_sessions += 1
-            total_attempts += 1
-        
-        print(f"   ✅ Created {finals_count} finals attempts")
-        
-        # 3. Create Review Mode attempts (20-30 attempts)
-        print("📝 Creating Review Mode attempts...")
-        review_count = random.randint(20, 30)
-        
-        # Review mode options
-        review_modes = ['elimination', 'finals']
-        review_difficulties = ['easy', 'average', 'difficult']
-        
-        for i in range(review_count):
-            days_ago = random.randint(0, 30)
-            created_at = end_date - timedelta(
-                days=days_ago,
-                hours=random.randint(0, 23),
-                minutes=random.randint(0, 59)
-            )
-            
-            # Randomly select mode and difficulty for this review attempt
-            mode = random.choice(review_modes)
-            difficulty = random.choice(review_difficulties)
-            
-            # Randomly select a topic and subtopic
-            topic = random.choice(topics)
-            subtopic = random.choice(topic['subtopics'])
-            
-            # Load real questions for this review
-            questions = load_real_questions(
-                topic['id'], 
-                subtopic['id'], 
-                mode, 
-                difficulty if mode == 'finals' else 'average',
-                count=10
-            )
-            
-            # Skip if no questions available
-            if not questions:
-                continue
+                    answers = None
+                    correct_count = sample_correct_count(len(questions), score_range, rng)
                 
-            session = QuizSession(
-                quiz_type='review',
-                questions=questions,
-                topic=topic['id'],
-                subtopic=subtopic['id'],
-                difficulty=difficulty if mode == 'finals' else None,
-                user_name=random.choice(SAMPLE_NAMES),
-                ttl_seconds=3600
-            )
-            # Shorter session ID to avoid database length limit
-            mode_short = 'e' if mode == 'elimination' else 'f'  # e or f
-            diff_short = difficulty[0]  # e, a, or d
-            session.id = f'sample-r{mode_short}{diff_short}-{i:04d}'
-            session.created_at = created_at
-            session.expires_at = created_at + timedelta(seconds=3600)
-            session.completed = True
-            
-            db.session.add(session)
-            
-            # Review mode typically has moderate scores
-            score_range = (60, 90)
-            answers, correct_count = generate_sample_answers(
-                questions, mode, score_range
-            )
-            
-            # Assign random topic and subtopic
-            
-            # Create quiz mode label that distinguishes mode and difficulty
-            quiz_type = f'review_{mode}'
-            
-            incorrect_count = len(questions) - correct_count
-            score = (correct_count / len(questions)) * 100 if len(questions) > 0 else 0
-            time_taken = random.randint(300, 900)  # 5-15 minutes
-            
-            attempt = QuizAttempt(
-                session_id=session.id,
-                quiz_type=quiz_type,
-                score=score,
-                correct_count=correct_count,
-                incorrect_count=incorrect_count,
-                topic=topic['id'],
-                subtopic=subtopic['id'],
-                difficulty=difficulty if mode == 'finals' else None,
-                user_name=random.choice(SAMPLE_NAMES),
-                time_taken=time_taken,
-                answers=answers
-            )
-            attempt.created_at = created_at
-            attempt.completed_at = created_at + timedelta(seconds=time_taken)
-            
-            db.session.add(attempt)
-            total_sessions += 1
-            total_attempts += 1
+                total = cfg['score_total'] or len(questions)
+                incorrect_count = total - correct_count
+                score = (correct_count / total) * 100 if total > 0 else 0
+                time_taken = times_taken[i]
+                
+                attempt_rows.append(attempt_row(
+                    session_id, spec['attempt_type'], score, created_at, time_taken, answers,
+                    correct_count=correct_count,
+                    incorrect_count=incorrect_count,
+                    topic=spec['topic'],
+                    subtopic=spec['subtopic'],
+                    difficulty=spec['attempt_difficulty'],
+                    user_name=attempt_names[i]
+                ))
+                total_sessions += 1
+                total_attempts += 1
+            
+            created_counts[cfg['name']] = count
+            print(f"   ✅ Created {count} {cfg['name']} attempts")
         
-        print(f"   ✅ Created {review_count} review attempts")
+        # Insert every generated row; same transaction, so the report query
+        # below already sees the attempts
+        insert_rows(session_rows, attempt_rows)
         
         # 4. Create sample question reports (10-25 reports)
         print("📝 Creating sample question reports...")
         report_count = 0
-        report_types = ['incorrect_answer', 'unclear_question', 'typo', 'outdated_info', 'other']
-        report_statuses = ['pending', 'reviewed', 'resolved', 'dismissed']
+        report_rows = []
         
         # Collect question IDs from attempts for realistic reports
         all_question_ids = []
-        sample_attempts_for_reports = db.session.query(QuizAttempt).filter(
-            QuizAttempt.session_id.like('sample-%')
-        ).all()
+        # Only the columns used below, for the first 30 attempts
+        sample_attempts_for_reports = db.session.query(
+            QuizAttempt.answers_json,
+            QuizAttempt.topic,
+            QuizAttempt.subtopic,
+            QuizAttempt.difficulty,
+            QuizAttempt.quiz_type
+        ).filter(
+            is_sample_id(QuizAttempt.session_id)
+        ).limit(30).all()
         
-        for attempt in sample_attempts_for_reports[:30]:  # Use first 30 attempts
-            answers = attempt.get_answers()
-            if not answers:
+        for attempt in sample_attempts_for_reports:
+            if not attempt.answers_json:
                 continue
+            answers = load_json(attempt.answers_json)
                 
             for answer in answers:
                 question_id = answer.get('question_id')
@@ -496,7 +712,7 @@ def insert_sample_data():
                     # But favor incorrect ones (60% incorrect, 40% correct)
                     is_correct = answer.get('is_correct', False)
                     
-                    if not is_correct or random.random() < 0.4:
+                    if not is_correct or rng.random() < 0.4:
                         all_question_ids.append({
                             'question_id': question_id,
                             'question_text': answer.get('question', '')[:200],  # Limit length
@@ -508,12 +724,12 @@ def insert_sample_data():
                         })
         
         # Create 10-25 random reports with unique question IDs
-        num_reports = random.randint(10, 25)
+        num_reports = rng.randint(10, 25)
         used_question_ids = set()  # Track to avoid duplicates
         
         if all_question_ids:
             # Shuffle to get random selection
-            random.shuffle(all_question_ids)
+            rng.shuffle(all_question_ids)
             
             for q_data in all_question_ids:
                 if report_count >= num_reports:
@@ -525,126 +741,74 @@ def insert_sample_data():
                     
                 used_question_ids.add(q_data['question_id'])
                 
-                days_ago = random.randint(0, 30)
-                created_at = end_date - timedelta(
-                    days=days_ago,
-                    hours=random.randint(0, 23),
-                    minutes=random.randint(0, 59)
-                )
+                created_at, _ = random_created_at(end_date, rng)
                 
                 # Choose report type based on whether answer was correct
                 if q_data.get('is_correct'):
                     # For correct answers, more likely to be typo/unclear
-                    report_type = random.choice(['typo', 'unclear_question', 'outdated_info'])
+                    report_type = rng.choice(CORRECT_ANSWER_REPORT_TYPES)
                 else:
                     # For incorrect answers, could be any type
-                    report_type = random.choice(report_types)
+                    report_type = rng.choice(REPORT_TYPES)
                 
-                # Status distribution: 40% pending, 30% reviewed, 20% resolved, 10% dismissed
-                status_weights = [0.4, 0.3, 0.2, 0.1]
-                status = random.choices(report_statuses, weights=status_weights)[0]
+                status = rng.choices(REPORT_STATUSES, weights=REPORT_STATUS_WEIGHTS)[0]
                 
                 # Generate more realistic reasons based on report type
-                reason_templates = {
-                    'incorrect_answer': [
-                        "The correct answer seems wrong. I believe option {alt} is correct.",
-                        "Multiple options could be correct. Please clarify.",
-                        "The explanation contradicts the marked correct answer."
-                    ],
-                    'unclear_question': [
-                        "The question wording is confusing and ambiguous.",
-                        "Question lacks context to determine the correct answer.",
-                        "The question could be interpreted in multiple ways."
-                    ],
-                    'typo': [
-                        "There's a spelling mistake in the question.",
-                        "Grammar error makes the question unclear.",
-                        "Formatting issue in one of the options."
-                    ],
-                    'outdated_info': [
-                        "The information in this question is outdated.",
-                        "This technology/standard has been updated since this question was written.",
-                        "Current best practices differ from what's stated."
-                    ],
-                    'other': [
-                        "This question seems out of scope for the topic.",
-                        "Question difficulty doesn't match the indicated level.",
-                        "Similar question appears multiple times in the quiz."
-                    ]
-                }
-                
-                reason = random.choice(reason_templates.get(report_type, ["Sample report issue"]))
+                reason = rng.choice(REASON_TEMPLATES.get(report_type, DEFAULT_REASONS))
                 if '{alt}' in reason:
-                    reason = reason.replace('{alt}', random.choice(['A', 'B', 'C', 'D']))
+                    reason = reason.replace('{alt}', rng.choice(OPTION_LETTERS))
                 
-                report = QuestionReport(
-                    question_id=q_data['question_id'],
-                    report_type=report_type,
-                    reason=reason,
-                    user_name=random.choice(SAMPLE_NAMES),
+                # If reviewed, resolved, or dismissed, add review data
+                review = {}
+                if status in ['reviewed', 'resolved', 'dismissed']:
+                    review = {
+                        'reviewed_by': 'admin',
+                        'reviewed_at': created_at + timedelta(hours=rng.randint(1, 72)),
+                        # Generate realistic admin notes based on status
+                        'admin_notes': rng.choice(ADMIN_NOTES[status])
+                    }
+                
+                report_rows.append(report_row(
+                    f'sample-report-{report_count:04d}',
+                    q_data['question_id'],
+                    report_type,
+                    reason,
+                    created_at,
+                    {'sample': True, 'is_correct_when_reported': q_data.get('is_correct')},
+                    status=status,
+                    user_name=rng.choice(SAMPLE_NAMES),
                     topic=q_data.get('topic'),
                     subtopic=q_data.get('subtopic'),
                     quiz_type=q_data.get('quiz_type', 'elimination'),
                     difficulty=q_data.get('difficulty'),
                     question_text=q_data.get('question_text', ''),
-                    question_data={'sample': True, 'is_correct_when_reported': q_data.get('is_correct')}
-                )
-                report.id = f'sample-report-{report_count:04d}'
-                report.created_at = created_at
-                report.status = status
-                
-                # If reviewed, resolved, or dismissed, add review data
-                if status in ['reviewed', 'resolved', 'dismissed']:
-                    report.reviewed_by = 'admin'
-                    report.reviewed_at = created_at + timedelta(hours=random.randint(1, 72))
-                    
-                    # Generate realistic admin notes based on status
-                    if status == 'resolved':
-                        report.admin_notes = random.choice([
-                            'Fixed the error in question data. Updated correct answer.',
-                            'Corrected typo and updated question text.',
-                            'Updated question with current information.',
-                            'Clarified question wording based on feedback.'
-                        ])
-                    elif status == 'reviewed':
-                        report.admin_notes = random.choice([
-                            'Under review. Checking with subject matter expert.',
-                            'Investigating the reported issue.',
-                            'Needs verification before making changes.'
-                        ])
-                    elif status == 'dismissed':
-                        report.admin_notes = random.choice([
-                            'Question is correct as written. Explanation added.',
-                            'Unable to reproduce the reported issue.',
-                            'Report appears to be based on misunderstanding.'
-                        ])
-                
-                db.session.add(report)
+                    **review
+                ))
                 report_count += 1
         
         # Add a few reports for questions that might not exist (edge cases)
         for i in range(min(3, num_reports - report_count)):
-            days_ago = random.randint(0, 30)
-            created_at = end_date - timedelta(days=days_ago, hours=random.randint(0, 23))
-            
-            report = QuestionReport(
-                question_id=f'nonexistent_q_{i}',
-                report_type='other',
-                reason='Sample report for testing edge cases',
-                user_name=random.choice(SAMPLE_NAMES),
+            days_ago = rng.randint(0, 30)
+            created_at = end_date - timedelta(days=days_ago, hours=rng.randint(0, 23))
+            
+            report_rows.append(report_row(
+                f'sample-report-edge-{i:04d}',
+                f'nonexistent_q_{i}',
+                'other',
+                'Sample report for testing edge cases',
+                created_at,
+                {'sample': True, 'edge_case': True},
+                user_name=rng.choice(SAMPLE_NAMES),
                 topic='test_topic',
                 subtopic='test_subtopic',
                 quiz_type='elimination',
-                question_text='[Question no longer exists]',
-                question_data={'sample': True, 'edge_case': True}
-            )
-            report.id = f'sample-report-edge-{i:04d}'
-            report.created_at = created_at
-            report.status = 'pending'
-            
-            db.session.add(report)
+                difficulty=None,
+                question_text='[Question no longer exists]'
+            ))
             report_count += 1
         
+        if report_rows:
+            db.session.connection().execute(QuestionReport.__table__.insert(), report_rows)
         print(f"   ✅ Created {report_count} question reports")
         
         # Commit all changes
@@ -657,9 +821,9 @@ def insert_sample_data():
         print(f"\n📊 Summary:")
         print(f"   • Total Sessions: {total_sessions}")
         print(f"   • Total Attempts: {total_attempts}")
-        print(f"   • Elimination Attempts: {elimination_count}")
-        print(f"   • Finals Attempts: {finals_count}")
-        print(f"   • Review Attempts: {review_count}")
+        print(f"   • Elimination Attempts: {created_counts['elimination']}")
+        print(f"   • Finals Attempts: {created_counts['finals']}")
+        print(f"   • Review Attempts: {created_counts['review']}")
         print(f"   • Question Reports: {report_count}")
         print(f"   • Date Range: Last 30 days")
         print(f"\n🌐 View the data:")
@@ -672,8 +836,16 @@ def insert_sample_data():
         print()
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Insert sample quiz data for the admin dashboard")
+    parser.add_argument(
+        '--no-answers', action='store_true',
+        help="Store scores only, without per-question answers (smaller and faster; "
+             "question analytics and reports will be mostly empty)"
+    )
+    args = parser.parse_args()
+    
     try:
-        insert_sample_data()
+        insert_sample_data(include_answers=not args.no_answers)
     except Exception as e:
         print(f"\n❌ Error: {e}")
         print("\nTroubleshooting:")
@@ -5,18 +5,24 @@ Cleans up test data created by insert_sample_data.py
 
 import os
 import sys
-from dotenv import load_dotenv
-from flask import Flask
 
 # Add parent directory to path to import models
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-from models import db, QuizSession, QuizAttempt, QuestionReport, init_db
 
-# Load environment variables
-load_dotenv()
+# Flask, SQLAlchemy and the models are imported where they are used so the
+# script starts (and reports connection errors) without loading them up front
+
+# Maximum rows removed per DELETE statement / transaction
+DELETE_BATCH_SIZE = 10000
 
 def create_app():
     """Create Flask app for database operations"""
+    from dotenv import load_dotenv
+    from flask import Flask
+    
+    # Load environment variables
+    load_dotenv()
+    
     app = Flask(__name__)
     app.secret_key = os.environ.get('SECRET_KEY', 'dev-secret-key-change-in-production')
     
@@ -33,94 +39,258 @@ def create_app():
     app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
         'pool_pre_ping': True,
         'pool_recycle': 3600,
+        'pool_size': 1,         # Single-threaded script: one connection is enough
+        'max_overflow': 0,
         'echo': False
     }
     
     return app
 
-def remove_sample_data():
-    """Remove all sample data from the database"""
-    print("="*70)
-    print("IT-QUIZBEE: Remove Sample Data")
-    print("="*70)
-    print()
+def _batch_delete(model, *criteria, batch_size=DELETE_BATCH_SIZE):
+    """
+    Delete matching rows in batches, committing after each batch
     
-    app = create_app()
-    init_db(app)
+    Keeps every transaction (row locks, undo log) small instead of removing
+    a whole table in one statement. Uses MySQL's DELETE ... LIMIT. The
+    session is closed afterwards so each table is cleared in its own
+    session and the connection goes back to the pool between tables.
     
-    with app.app_context():
-        # Count existing sample data
-        sample_sessions = QuizSession.query.filter(
-            QuizSession.id.like('sample-%')
-        ).all()
+    Args:
+        model: Model class whose table rows are deleted
+        *criteria: Optional WHERE clauses; all rows are deleted if omitted
+        batch_size: Maximum rows deleted per statement
         
-        sample_attempts = QuizAttempt.query.filter(
-            QuizAttempt.session_id.like('sample-%')
-        ).all()
-        
-        sample_reports = QuestionReport.query.filter(
-            QuestionReport.id.like('sample-%')
-        ).all()
+    Returns:
+        Total number of rows deleted
+    """
+    import sqlalchemy as sa
+    from models import db
+    
+    # Core DELETE against the table skips ORM session bookkeeping entirely
+    stmt = sa.delete(model.__table__).where(*criteria).with_dialect_options(mysql_limit=batch_size)
+    total = 0
+    try:
+        while True:
+            deleted = db.session.execute(stmt).rowcount
+            db.session.commit()
+            total += deleted
+            if deleted < batch_size:
+                return total
+    except Exception:
+        db.session.rollback()
+        raise
+    finally:
+        db.session.close()
+
+def _delete_sample_sessions(batch_size=DELETE_BATCH_SIZE):
+    """
+    Delete sample sessions and their attempts in keyset-ordered batches
+    
+    Each batch selects the next session ids after the last one removed
+    (ORDER BY id over the primary key), then deletes their attempts and the
+    sessions themselves and commits. Every batch starts from a known
+    position in the index instead of rescanning from the start of the range.
+    
+    Args:
+        batch_size: Maximum sessions removed per transaction
         
-        if not sample_sessions and not sample_attempts and not sample_reports:
-            print("ℹ️  No sample data found in the database.")
-            print("\n💡 To create sample data, run: python scripts/insert_sample_data.py")
-            print("="*70)
-            print()
-            return
+    Returns:
+        Tuple of (sessions deleted, attempts deleted)
+    """
+    import sqlalchemy as sa
+    from models import db, QuizSession, QuizAttempt
+    
+    sessions = QuizSession.__table__
+    attempts = QuizAttempt.__table__
+    sessions_deleted = attempts_deleted = 0
+    last_id = ''
+    try:
+        while True:
+            ids = db.session.execute(
+                sa.select(sessions.c.id)
+                .where(sessions.c.id.like('sample-%'), sessions.c.id > last_id)
+                .order_by(sessions.c.id)
+                .limit(batch_size)
+            ).scalars().all()
+            if not ids:
+                break
+            
+            # Attempts first so databases without ON DELETE CASCADE work too
+            attempts_deleted += db.session.execute(
+                sa.delete(attempts).where(attempts.c.session_id.in_(ids))
+            ).rowcount
+            sessions_deleted += db.session.execute(
+                sa.delete(sessions).where(sessions.c.id.in_(ids))
+            ).rowcount
+            db.session.commit()
+            
+            last_id = ids[-1]
+            if len(ids) < batch_size:
+                break
+    except Exception:
+        db.session.rollback()
+        raise
+    finally:
+        db.session.close()
+    
+    return sessions_deleted, attempts_deleted
+
+def _run(fn):
+    """
+    Run fn inside an application context, creating the app only once
+    
+    The Flask app and SQLAlchemy engine are cached on the function so that
+    running several phases in one process reuses a single setup.
+    
+    Args:
+        fn: Callable taking no arguments
         
-        print(f"📊 Found sample data:")
-        print(f"   • Sessions: {len(sample_sessions)}")
-        print(f"   • Attempts: {len(sample_attempts)}")
-        print(f"   • Question Reports: {len(sample_reports)}")
-        print()
+    Returns:
+        Whatever fn returns
+    """
+    if _run.app is None:
+        from models import init_db
         
-        # Confirm deletion
-        print("⚠️  WARNING: This will permanently delete all sample data!")
-        print("   This action cannot be undone.")
+        _run.app = create_app()
+        init_db(_run.app)
+    
+    with _run.app.app_context():
+        return fn()
+
+_run.app = None
+
+def _remove_sample_data():
+    """Count, confirm and delete sample rows (requires an app context)"""
+    import sqlalchemy as sa
+    from models import db, QuizSession, QuizAttempt, QuestionReport
+    
+    # Count existing sample data (COUNT(*) in the database, no rows loaded)
+    sample_sessions = db.session.query(sa.func.count(QuizSession.id)).filter(
+        QuizSession.id.like('sample-%')
+    ).scalar()
+    
+    sample_attempts = db.session.query(sa.func.count(QuizAttempt.id)).filter(
+        QuizAttempt.session_id.like('sample-%')
+    ).scalar()
+    
+    sample_reports = db.session.query(sa.func.count(QuestionReport.id)).filter(
+        QuestionReport.id.like('sample-%')
+    ).scalar()
+    
+    if not sample_sessions and not sample_attempts and not sample_reports:
+        print("ℹ️  No sample data found in the database.")
+        print("\n💡 To create sample data, run: python scripts/insert_sample_data.py")
+        print("="*70)
         print()
-        response = input("Type 'DELETE' to confirm removal: ").strip()
-        
-        if response != 'DELETE':
-            print("\n❌ Operation cancelled. No data was removed.")
-            print("="*70)
-            print()
-            return
-        
-        print("\n🗑️  Removing sample data...")
-        
-        # Delete reports first
-        reports_deleted = QuestionReport.query.filter(
-            QuestionReport.id.like('sample-%')
-        ).delete(synchronize_session=False)
-        
-        # Delete attempts (due to foreign key constraint)
-        attempts_deleted = QuizAttempt.query.filter(
-            QuizAttempt.session_id.like('sample-%')
-        ).delete(synchronize_session=False)
-        
-        # Delete sessions
-        sessions_deleted = QuizSession.query.filter(
-            QuizSession.id.like('sample-%')
-        ).delete(synchronize_session=False)
-        
-        # Commit changes
-        db.session.commit()
-        
-        print("\n" + "="*70)
-        print("✅ SAMPLE DATA SUCCESSFULLY REMOVED!")
+        return
+    
+    print(f"📊 Found sample data:")
+    print(f"   • Sessions: {sample_sessions}")
+    print(f"   • Attempts: {sample_attempts}")
+    print(f"   • Question Reports: {sample_reports}")
+    print()
+    
+    # Confirm deletion
+    print("⚠️  WARNING: This will permanently delete all sample data!")
+    print("   This action cannot be undone.")
+    print()
+    response = input("Type 'DELETE' to confirm removal: ").strip()
+    
+    if response != 'DELETE':
+        print("\n❌ Operation cancelled. No data was removed.")
         print("="*70)
-        print(f"\n📊 Deletion Summary:")
-        print(f"   • Sessions Removed: {sessions_deleted}")
-        print(f"   • Attempts Removed: {attempts_deleted}")
-        print(f"   • Question Reports Removed: {reports_deleted}")
-        print(f"\n🌐 Verify removal:")
-        print(f"   • Admin Dashboard: http://localhost:5000/admin/dashboard")
-        print(f"   • Question Reports: http://localhost:5000/admin/question-reports")
-        print(f"   • API Summary: http://localhost:5000/api/statistics/overview")
-        print("\n💡 To add sample data again, run: python scripts/insert_sample_data.py")
+        print()
+        return
+    
+    print("\n🗑️  Removing sample data...")
+    
+    # Delete reports first
+    reports_deleted = _batch_delete(QuestionReport, QuestionReport.id.like('sample-%'))
+    
+    # Delete sessions together with their attempts, walking session ids in order
+    sessions_deleted, attempts_deleted = _delete_sample_sessions()
+    
+    print("\n" + "="*70)
+    print("✅ SAMPLE DATA SUCCESSFULLY REMOVED!")
+    print("="*70)
+    print(f"\n📊 Deletion Summary:")
+    print(f"   • Sessions Removed: {sessions_deleted}")
+    print(f"   • Attempts Removed: {attempts_deleted}")
+    print(f"   • Question Reports Removed: {reports_deleted}")
+    print(f"\n🌐 Verify removal:")
+    print(f"   • Admin Dashboard: http://localhost:5000/admin/dashboard")
+    print(f"   • Question Reports: http://localhost:5000/admin/question-reports")
+    print(f"   • API Summary: http://localhost:5000/api/statistics/overview")
+    print("\n💡 To add sample data again, run: python scripts/insert_sample_data.py")
+    print("="*70)
+    print()
+
+def _remove_all_data():
+    """Count, confirm and delete every row (requires an app context)"""
+    from models import QuizSession, QuizAttempt, QuestionReport
+    
+    # Count all data
+    all_sessions = QuizSession.query.count()
+    all_attempts = QuizAttempt.query.count()
+    all_reports = QuestionReport.query.count()
+    
+    if all_sessions == 0 and all_attempts == 0 and all_reports == 0:
+        print("ℹ️  Database is already empty.")
         print("="*70)
         print()
+        return
+    
+    print(f"📊 Current database contents:")
+    print(f"   • Total Sessions: {all_sessions}")
+    print(f"   • Total Attempts: {all_attempts}")
+    print(f"   • Total Question Reports: {all_reports}")
+    print()
+    
+    # Triple confirmation for deleting all data
+    print("⚠️  DANGER: This will DELETE ALL quiz data from the database!")
+    print("   This includes both sample data AND real quiz attempts!")
+    print("   This action is PERMANENT and CANNOT be undone!")
+    print()
+    
+    response1 = input("Are you absolutely sure? Type 'YES' to continue: ").strip()
+    if response1 != 'YES':
+        print("\n❌ Operation cancelled.")
+        return
+    
+    response2 = input("Type 'DELETE ALL DATA' to confirm: ").strip()
+    if response2 != 'DELETE ALL DATA':
+        print("\n❌ Operation cancelled.")
+        return
+    
+    print("\n🗑️  Removing ALL data from database...")
+    
+    # Delete all reports first
+    reports_deleted = _batch_delete(QuestionReport)
+    
+    # Delete all attempts
+    attempts_deleted = _batch_delete(QuizAttempt)
+    
+    # Delete all sessions
+    sessions_deleted = _batch_delete(QuizSession)
+    
+    print("\n" + "="*70)
+    print("✅ ALL DATA REMOVED!")
+    print("="*70)
+    print(f"\n📊 Deletion Summary:")
+    print(f"   • Sessions Removed: {sessions_deleted}")
+    print(f"   • Attempts Removed: {attempts_deleted}")
+    print(f"   • Question Reports Removed: {reports_deleted}")
+    print(f"\n⚠️  The database is now empty!")
+    print("="*70)
+    print()
+
+def remove_sample_data():
+    """Remove all sample data from the database"""
+    print("="*70)
+    print("IT-QUIZBEE: Remove Sample Data")
+    print("="*70)
+    print()
+    return _run(_remove_sample_data)
 
 def remove_all_data():
     """Remove ALL data from the database (use with extreme caution)"""
@@ -128,68 +298,7 @@ def remove_all_data():
     print("IT-QUIZBEE: Remove ALL Data (DANGEROUS)")
     print("="*70)
     print()
-    
-    app = create_app()
-    init_db(app)
-    
-    with app.app_context():
-        # Count all data
-        all_sessions = QuizSession.query.count()
-        all_attempts = QuizAttempt.query.count()
-        all_reports = QuestionReport.query.count()
-        
-        if all_sessions == 0 and all_attempts == 0 and all_reports == 0:
-            print("ℹ️  Database is already empty.")
-            print("="*70)
-            print()
-            return
-        
-        print(f"📊 Current database contents:")
-        print(f"   • Total Sessions: {all_sessions}")
-        print(f"   • Total Attempts: {all_attempts}")
-        print(f"   • Total Question Reports: {all_reports}")
-        print()
-        
-        # Triple confirmation for deleting all data
-        print("⚠️  DANGER: This will DELETE ALL quiz data from the database!")
-        print("   This includes both sample data AND real quiz attempts!")
-        print("   This action is PERMANENT and CANNOT be undone!")
-        print()
-        
-        response1 = input("Are you absolutely sure? Type 'YES' to continue: ").strip()
-        if response1 != 'YES':
-            print("\n❌ Operation cancelled.")
-            return
-        
-        response2 = input("Type 'DELETE ALL DATA' to confirm: ").strip()
-        if response2 != 'DELETE ALL DATA':
-            print("\n❌ Operation cancelled.")
-            return
-        
-        print("\n🗑️  Removing ALL data from database...")
-        
-        # Delete all reports first
-        reports_deleted = QuestionReport.query.delete()
-        
-        # Delete all attempts
-        attempts_deleted = QuizAttempt.query.delete()
-        
-        # Delete all sessions
-        sessions_deleted = QuizSession.query.delete()
-        
-        # Commit changes
-        db.session.commit()
-        
-        print("\n" + "="*70)
-        print("✅ ALL DATA REMOVED!")
-        print("="*70)
-        print(f"\n📊 Deletion Summary:")
-        print(f"   • Sessions Removed: {sessions_deleted}")
-        print(f"   • Attempts Removed: {attempts_deleted}")
-        print(f"   • Question Reports Removed: {reports_deleted}")
-        print(f"\n⚠️  The database is now empty!")
-        print("="*70)
-        print()
+    return _run(_remove_all_data)
 
 if __name__ == '__main__':
     import sys
@@ -8,6 +8,12 @@ import sys
 import json
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the standard library
+    orjson = None
 
 # Add parent directory to path if needed
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
@@ -16,13 +22,11 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 DATA_DIR = Path(__file__).parent.parent / "data"
 TOPICS_FILE = Path(__file__).parent.parent / "docs/TOPICS.md"
 
-import json
-from pathlib import Path
-from datetime import datetime
+# Worker threads used to scan topic folders
+MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
 
-# Base directory
-DATA_DIR = Path(__file__).parent / "data"
-TOPICS_FILE = Path(__file__).parent / "docs/TOPICS.md"
+# Footer line that changes on every run; ignored when checking for changes
+LAST_UPDATED_PREFIX = "*Last updated: "
 
 # Topic display names mapping
 TOPIC_NAMES = {
@@ -55,12 +59,15 @@ TOPIC_DESCRIPTIONS = {
 
 def read_json(file_path):
     """Read JSON file"""
+    if orjson is not None:
+        with open(file_path, 'rb') as f:
+            return orjson.loads(f.read())
     with open(file_path, 'r', encoding='utf-8') as f:
         return json.load(f)
 
 
 def count_questions_in_file(file_path):
-    """Count questions in a JSON file"""
+    """Count questions in a JSON file (0 if it is missing or unreadable)"""
     try:
         data = read_json(file_path)
         return len(data.get("questions", []))
@@ -86,30 +93,19 @@ def scan_topic(topic_path):
         subtopic_id = subtopic["id"]
         subtopic_name = subtopic["name"]
         
-        # Count questions in different modes
+        # Count questions in different modes. Missing files count as 0, so
+        # open them directly instead of stat-ing each one first
         subtopic_dir = topic_path / subtopic_id
-        
-        elimination_count = 0
-        finals_easy_count = 0
-        finals_average_count = 0
-        finals_difficult_count = 0
+        file_name = f"{subtopic_id}.json"
         
         # Check elimination questions
-        elim_file = subtopic_dir / "elimination" / f"{subtopic_id}.json"
-        if elim_file.exists():
-            elimination_count = count_questions_in_file(elim_file)
+        elimination_count = count_questions_in_file(subtopic_dir / "elimination" / file_name)
         
         # Check finals questions (all difficulty levels)
-        finals_easy_file = subtopic_dir / "finals" / "easy" / f"{subtopic_id}.json"
-        finals_avg_file = subtopic_dir / "finals" / "average" / f"{subtopic_id}.json"
-        finals_diff_file = subtopic_dir / "finals" / "difficult" / f"{subtopic_id}.json"
-        
-        if finals_easy_file.exists():
-            finals_easy_count = count_questions_in_file(finals_easy_file)
-        if finals_avg_file.exists():
-            finals_average_count = count_questions_in_file(finals_avg_file)
-        if finals_diff_file.exists():
-            finals_difficult_count = count_questions_in_file(finals_diff_file)
+        finals_dir = subtopic_dir / "finals"
+        finals_easy_count = count_questions_in_file(finals_dir / "easy" / file_name)
+        finals_average_count = count_questions_in_file(finals_dir / "average" / file_name)
+        finals_difficult_count = count_questions_in_file(finals_dir / "difficult" / file_name)
         
         total_finals = finals_easy_count + finals_average_count + finals_difficult_count
         total_questions = elimination_count + total_finals
@@ -147,16 +143,23 @@ def generate_topics_md():
     total_elimination_questions = 0
     total_finals_questions = 0
     
-    for topic_dir in sorted(DATA_DIR.iterdir()):
-        if topic_dir.is_dir():
-            topic_data = scan_topic(topic_dir)
-            if topic_data:
-                all_topics.append(topic_data)
-                total_subtopics += len(topic_data["subtopics"])
-                
-                for subtopic in topic_data["subtopics"]:
-                    total_elimination_questions += subtopic["elimination"]
-                    total_finals_questions += subtopic["total_finals"]
+    # Topics are independent, so scan them concurrently (file reads dominate);
+    # map() keeps results in directory order
+    # os.scandir reports entry types from the directory listing, avoiding a stat per entry
+    with os.scandir(DATA_DIR) as entries:
+        topic_dirs = [Path(entry.path) for entry in entries if entry.is_dir()]
+    topic_dirs.sort()
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        scanned = list(executor.map(scan_topic, topic_dirs))
+    
+    for topic_data in scanned:
+        if topic_data:
+            all_topics.append(topic_data)
+            total_subtopics += len(topic_data["subtopics"])
+            
+            for subtopic in topic_data["subtopics"]:
+                total_elimination_questions += subtopic["elimination"]
+                total_finals_questions += subtopic["total_finals"]
     
     # Generate markdown content
     md_content = []
@@ -258,12 +261,19 @@ def generate_topics_md():
     
     # Footer
     md_content.append("---\n")
-    md_content.append(f"*Last updated: {datetime.now().strftime('%B %d, %Y at %I:%M %p')}*")
+    md_content.append(f"{LAST_UPDATED_PREFIX}{datetime.now().strftime('%B %d, %Y at %I:%M %p')}*")
     md_content.append(f"\n*Generated automatically by `update_topics_md.py`*\n")
     
     return "\n".join(md_content)
 
 
+def strip_timestamp(content):
+    """Remove the 'Last updated' line so generated content can be compared"""
+    return "\n".join(
+        line for line in content.split("\n") if not line.startswith(LAST_UPDATED_PREFIX)
+    )
+
+
 def main():
     """Main execution function"""
     print("="*60)
@@ -278,10 +288,19 @@ def main():
         print("\n❌ Failed to generate TOPICS.md content")
         return
     
-    # Write to file
+    # Skip the write when only the timestamp would change
+    if TOPICS_FILE.exists():
+        current_content = TOPICS_FILE.read_text(encoding='utf-8')
+        if strip_timestamp(current_content) == strip_timestamp(new_content):
+            print("\n✅ TOPICS.md is already up to date (no changes written)")
+            return
+    
+    # Write to a temporary file and rename it over TOPICS.md, so an
+    # interrupted run never leaves a truncated document behind
+    tmp_file = TOPICS_FILE.with_name(TOPICS_FILE.name + ".tmp")
     try:
-        with open(TOPICS_FILE, 'w', encoding='utf-8') as f:
-            f.write(new_content)
+        tmp_file.write_bytes(new_content.encode('utf-8'))
+        os.replace(tmp_file, TOPICS_FILE)
         
         print("\n✅ TOPICS.md has been successfully updated!")
         print(f"   Location: {TOPICS_FILE}")
@@ -293,6 +312,7 @@ def main():
         print(f"   - File size: {len(new_content)} characters")
         
     except Exception as e:
+        tmp_file.unlink(missing_ok=True)
         print(f"\n❌ Error writing TOPICS.md: {e}")
 
 
@@ -7,6 +7,7 @@ import os
 import sys
 from dotenv import load_dotenv
 from flask import Flask
+from sqlalchemy import func
 
 # Add parent directory to path to import models
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
@@ -33,6 +34,8 @@ def create_app():
     app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
         'pool_pre_ping': True,
         'pool_recycle': 3600,
+        'pool_size': 1,         # Single-threaded script: one connection is enough
+        'max_overflow': 0,
         'echo': False
     }
     
@@ -49,18 +52,17 @@ def verify_sample_data():
     init_db(app)
     
     with app.app_context():
-        # Count sample data
+        is_sample_attempt = QuizAttempt.session_id.like('sample-%')
+        is_sample_report = QuestionReport.id.like('sample-%')
+        
+        # Count sample data (COUNT(*) in the database, no rows loaded)
         sample_sessions = QuizSession.query.filter(
             QuizSession.id.like('sample-%')
-        ).all()
+        ).count()
         
-        sample_attempts = QuizAttempt.query.filter(
-            QuizAttempt.session_id.like('sample-%')
-        ).all()
+        sample_attempts = QuizAttempt.query.filter(is_sample_attempt).count()
         
-        sample_reports = QuestionReport.query.filter(
-            QuestionReport.id.like('sample-%')
-        ).all()
+        sample_reports = QuestionReport.query.filter(is_sample_report).count()
         
         # Count all data
         total_sessions = QuizSession.query.count()
@@ -74,12 +76,12 @@ def verify_sample_data():
         print()
         
         print("🧪 Sample Data:")
-        print(f"   • Sample Sessions: {len(sample_sessions)}")
-        print(f"   • Sample Attempts: {len(sample_attempts)}")
-        print(f"   • Sample Question Reports: {len(sample_reports)}")
+        print(f"   • Sample Sessions: {sample_sessions}")
+        print(f"   • Sample Attempts: {sample_attempts}")
+        print(f"   • Sample Question Reports: {sample_reports}")
         print()
         
-        if len(sample_attempts) == 0:
+        if sample_attempts == 0:
             print("ℹ️  No sample data found.")
             print()
             print("💡 To create sample data:")
@@ -91,68 +93,70 @@ def verify_sample_data():
         # Breakdown by mode
         print("📋 Sample Attempts by Mode:")
         
-        elimination_count = sum(1 for a in sample_attempts if a.quiz_type == 'elimination')
-        finals_count = sum(1 for a in sample_attempts if a.quiz_type == 'finals')
-        review_elimination = sum(1 for a in sample_attempts if a.quiz_type == 'review_elimination')
-        review_finals = sum(1 for a in sample_attempts if a.quiz_type == 'review_finals')
+        mode_counts = dict(
+            db.session.query(QuizAttempt.quiz_type, func.count(QuizAttempt.id))
+            .filter(is_sample_attempt)
+            .group_by(QuizAttempt.quiz_type)
+            .all()
+        )
         
-        print(f"   • Elimination: {elimination_count} attempts")
-        print(f"   • Finals: {finals_count} attempts")
-        print(f"   • Review (Elimination): {review_elimination} attempts")
-        print(f"   • Review (Finals): {review_finals} attempts")
+        print(f"   • Elimination: {mode_counts.get('elimination', 0)} attempts")
+        print(f"   • Finals: {mode_counts.get('finals', 0)} attempts")
+        print(f"   • Review (Elimination): {mode_counts.get('review_elimination', 0)} attempts")
+        print(f"   • Review (Finals): {mode_counts.get('review_finals', 0)} attempts")
         print()
         
         # Question reports breakdown
         if sample_reports:
             print("📝 Sample Question Reports:")
-            pending = sum(1 for r in sample_reports if r.status == 'pending')
-            reviewed = sum(1 for r in sample_reports if r.status == 'reviewed')
-            resolved = sum(1 for r in sample_reports if r.status == 'resolved')
-            dismissed = sum(1 for r in sample_reports if r.status == 'dismissed')
+            status_counts = dict(
+                db.session.query(QuestionReport.status, func.count(QuestionReport.id))
+                .filter(is_sample_report)
+                .group_by(QuestionReport.status)
+                .all()
+            )
             
-            print(f"   • Pending: {pending}")
-            print(f"   • Reviewed: {reviewed}")
-            print(f"   • Resolved: {resolved}")
-            print(f"   • Dismissed: {dismissed}")
+            print(f"   • Pending: {status_counts.get('pending', 0)}")
+            print(f"   • Reviewed: {status_counts.get('reviewed', 0)}")
+            print(f"   • Resolved: {status_counts.get('resolved', 0)}")
+            print(f"   • Dismissed: {status_counts.get('dismissed', 0)}")
             
             # Report types breakdown
-            if len(sample_reports) > 0:
-                report_types_count = {}
-                for r in sample_reports:
-                    report_types_count[r.report_type] = report_types_count.get(r.report_type, 0) + 1
-                
-                print(f"\n   Report Types:")
-                for rtype, count in sorted(report_types_count.items(), key=lambda x: x[1], reverse=True):
-                    print(f"      - {rtype}: {count}")
-            print()
-        
-        # Score statistics
-        if sample_attempts:
-            scores = [a.score for a in sample_attempts]
-            avg_score = sum(scores) / len(scores)
-            min_score = min(scores)
-            max_score = max(scores)
+            report_types_count = (
+                db.session.query(QuestionReport.report_type, func.count(QuestionReport.id))
+                .filter(is_sample_report)
+                .group_by(QuestionReport.report_type)
+                .all()
+            )
             
-            print("📈 Score Statistics:")
-            print(f"   • Average: {avg_score:.1f}%")
-            print(f"   • Minimum: {min_score:.1f}%")
-            print(f"   • Maximum: {max_score:.1f}%")
+            print(f"\n   Report Types:")
+            for rtype, count in sorted(report_types_count, key=lambda x: x[1], reverse=True):
+                print(f"      - {rtype}: {count}")
             print()
         
-        # Date range
-        if sample_attempts:
-            dates = [a.created_at for a in sample_attempts]
-            oldest = min(dates)
-            newest = max(dates)
-            
-            print("📅 Date Range:")
-            print(f"   • Oldest: {oldest.strftime('%Y-%m-%d %H:%M')}")
-            print(f"   • Newest: {newest.strftime('%Y-%m-%d %H:%M')}")
-            print()
+        # Score statistics and date range, aggregated in one query
+        avg_score, min_score, max_score, oldest, newest = db.session.query(
+            func.avg(QuizAttempt.score),
+            func.min(QuizAttempt.score),
+            func.max(QuizAttempt.score),
+            func.min(QuizAttempt.created_at),
+            func.max(QuizAttempt.created_at)
+        ).filter(is_sample_attempt).one()
+        
+        print("📈 Score Statistics:")
+        print(f"   • Average: {avg_score:.1f}%")
+        print(f"   • Minimum: {min_score:.1f}%")
+        print(f"   • Maximum: {max_score:.1f}%")
+        print()
+        
+        print("📅 Date Range:")
+        print(f"   • Oldest: {oldest.strftime('%Y-%m-%d %H:%M')}")
+        print(f"   • Newest: {newest.strftime('%Y-%m-%d %H:%M')}")
+        print()
         
         # Real data (non-sample)
-        real_attempts = total_attempts - len(sample_attempts)
-        real_reports = total_reports - len(sample_reports)
+        real_attempts = total_attempts - sample_attempts
+        real_reports = total_reports - sample_reports
         if real_attempts > 0 or real_reports > 0:
             print("⚠️  Warning:")
             if real_attempts > 0:
@@ -145,9 +145,9 @@ class TestQuizService:
         mock_session.quiz_type = 'elimination'
         mock_session.topic = 'test_topic'
         mock_session.subtopic = 'test_subtopic'
-        mock_session.questions_json = json.dumps([
+        mock_session.get_questions.return_value = [
             {"id": "1", "question": "Q1?", "correct_answer": "A", "options": ["A", "B", "C", "D"]}
-        ])
+        ]
         mock_session_repo.get_by_id.return_value = mock_session
         
         # Setup mock attempt
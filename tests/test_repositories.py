@@ -110,6 +110,27 @@ class TestBaseRepository:
         
         assert repo.exists(sample_quiz_session.id) == True
         assert repo.exists('nonexistent') == False
+    
+    def test_bulk_create(self, db_session, sample_quiz_session):
+        """Test inserting many records at once"""
+        repo = QuizAttemptRepository()
+        
+        rows = [
+            {
+                'session_id': sample_quiz_session.id,
+                'quiz_type': 'elimination',
+                'score': 50.0 + i,
+                'correct_count': 5,
+                'incorrect_count': 5
+            }
+            for i in range(3)
+        ]
+        
+        inserted = repo.bulk_create(rows)
+        
+        assert inserted == 3
+        assert repo.count() == 3
+        assert repo.bulk_create([]) == 0
 
 
 class TestQuizSessionRepository: